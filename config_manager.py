@@ -8,10 +8,54 @@ import json
 from typing import Optional, Dict, Any
 from pathlib import Path
 
+# orjson is an optional speedup; fall back to the stdlib encoder when missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize to indented, key-sorted JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(data, indent=2, sort_keys=True).encode('utf-8')
+
 
 class Config:
     """Configuration settings for the middleware"""
     
+    # Attributes persisted by save_to_file and returned by to_dict
+    _PERSISTED_FIELDS = (
+        'DBF_INPUT_DIR',
+        'CSV_OUTPUT_DIR',
+        'LOG_DIR',
+        'STATE_FILE',
+        'POLL_INTERVAL',
+        'MAX_RETRIES',
+        'RETRY_DELAY',
+        'BATCH_SIZE',
+        'FILE_LOCK_TIMEOUT',
+        'FILE_LOCK_RETRY_DELAY',
+        'CSV_ENCODING',
+        'CSV_DELIMITER',
+        'PRESERVE_BACKUP_COUNT',
+        'MONITOR_FILE_PATTERNS',
+        'EXCLUDED_FIELDS',
+        'DEBUG_MODE',
+        'SYNC_WORKERS',
+        'INCLUDE_DESCRIPTION',
+    )
+    
+    __slots__ = ('config_file', '_config_mtime_ns') + _PERSISTED_FIELDS
+    
     def __init__(self, config_file: str = "config.json"):
         """
         Initialize configuration with defaults and load from file if exists
@@ -20,6 +64,7 @@ class Config:
             config_file: Path to the JSON configuration file
         """
         self.config_file: str = config_file
+        self._config_mtime_ns: int = 0  # mtime of the last successful load
         
         # Initialize with default values (mutable attributes)
         self.DBF_INPUT_DIR: str = "./RMan_Export/"
@@ -40,6 +85,8 @@ class Config:
         self.MONITOR_FILE_PATTERNS: list = ["*.DBF", "*.dbf"]
         self.EXCLUDED_FIELDS: list = ["TIMESTAMP", "MODIFIED", "DELETED"]
         self.DEBUG_MODE: bool = False
+        self.SYNC_WORKERS: Optional[int] = None  # DBF files synced concurrently (None = CPU count)
+        self.INCLUDE_DESCRIPTION: bool = False  # add a Description column to the ESL CSV
         
         # Load from file if it exists
         self.load_from_file()
@@ -60,25 +107,35 @@ class Config:
         """
         Load configuration from JSON file if it exists
         
+        The file is only parsed when its modification time differs from the
+        last successful load, so repeated calls are a single stat().
+        
         Returns:
-            True if config was loaded, False otherwise
+            True if config was loaded, False otherwise (missing or unchanged)
         """
-        if os.path.exists(self.config_file):
-            try:
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
-                
-                # Update attributes from loaded data
-                for key, value in config_data.items():
-                    if hasattr(self, key):
-                        setattr(self, key, value)
-                
-                return True
-                
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load config file {self.config_file}: {e}")
-                return False
-        return False
+        try:
+            mtime_ns = os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            return False
+        
+        if mtime_ns == self._config_mtime_ns:
+            return False
+        
+        try:
+            with open(self.config_file, 'rb') as f:
+                config_data = _json_loads(f.read())
+            
+            # Update attributes from loaded data
+            for key, value in config_data.items():
+                if hasattr(self, key):
+                    setattr(self, key, value)
+            
+            self._config_mtime_ns = mtime_ns
+            return True
+            
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Warning: Could not load config file {self.config_file}: {e}")
+            return False
     
     def save_to_file(self, file_path: Optional[str] = None) -> bool:
         """
@@ -92,29 +149,11 @@ class Config:
         """
         save_path = file_path or self.config_file
         
-        # Build configuration dictionary
-        config_data = {
-            "DBF_INPUT_DIR": self.DBF_INPUT_DIR,
-            "CSV_OUTPUT_DIR": self.CSV_OUTPUT_DIR,
-            "LOG_DIR": self.LOG_DIR,
-            "STATE_FILE": self.STATE_FILE,
-            "POLL_INTERVAL": self.POLL_INTERVAL,
-            "MAX_RETRIES": self.MAX_RETRIES,
-            "RETRY_DELAY": self.RETRY_DELAY,
-            "BATCH_SIZE": self.BATCH_SIZE,
-            "FILE_LOCK_TIMEOUT": self.FILE_LOCK_TIMEOUT,
-            "FILE_LOCK_RETRY_DELAY": self.FILE_LOCK_RETRY_DELAY,
-            "CSV_ENCODING": self.CSV_ENCODING,
-            "CSV_DELIMITER": self.CSV_DELIMITER,
-            "PRESERVE_BACKUP_COUNT": self.PRESERVE_BACKUP_COUNT,
-            "MONITOR_FILE_PATTERNS": self.MONITOR_FILE_PATTERNS,
-            "EXCLUDED_FIELDS": self.EXCLUDED_FIELDS,
-            "DEBUG_MODE": self.DEBUG_MODE
-        }
+        config_data = self.to_dict()
         
         try:
-            with open(save_path, 'w') as f:
-                json.dump(config_data, f, indent=4)
+            with open(save_path, 'wb') as f:
+                f.write(_json_dumps(config_data))
             return True
             
         except IOError as e:
@@ -139,24 +178,7 @@ class Config:
         Returns:
             Dictionary of configuration values
         """
-        return {
-            "DBF_INPUT_DIR": self.DBF_INPUT_DIR,
-            "CSV_OUTPUT_DIR": self.CSV_OUTPUT_DIR,
-            "LOG_DIR": self.LOG_DIR,
-            "STATE_FILE": self.STATE_FILE,
-            "POLL_INTERVAL": self.POLL_INTERVAL,
-            "MAX_RETRIES": self.MAX_RETRIES,
-            "RETRY_DELAY": self.RETRY_DELAY,
-            "BATCH_SIZE": self.BATCH_SIZE,
-            "FILE_LOCK_TIMEOUT": self.FILE_LOCK_TIMEOUT,
-            "FILE_LOCK_RETRY_DELAY": self.FILE_LOCK_RETRY_DELAY,
-            "CSV_ENCODING": self.CSV_ENCODING,
-            "CSV_DELIMITER": self.CSV_DELIMITER,
-            "PRESERVE_BACKUP_COUNT": self.PRESERVE_BACKUP_COUNT,
-            "MONITOR_FILE_PATTERNS": self.MONITOR_FILE_PATTERNS,
-            "EXCLUDED_FIELDS": self.EXCLUDED_FIELDS,
-            "DEBUG_MODE": self.DEBUG_MODE
-        }
+        return {key: getattr(self, key) for key in self._PERSISTED_FIELDS}
     
     def validate(self) -> tuple[bool, list[str]]:
         """
@@ -183,6 +205,9 @@ class Config:
         if self.RETRY_DELAY < 0:
             errors.append("RETRY_DELAY cannot be negative")
         
+        if self.SYNC_WORKERS is not None and self.SYNC_WORKERS < 1:
+            errors.append("SYNC_WORKERS must be at least 1")
+        
         return (len(errors) == 0, errors)
     
     def ensure_directories(self) -> bool:
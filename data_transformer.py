@@ -7,26 +7,102 @@ import os
 import csv
 import json
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Sized
+from datetime import datetime, timezone
 from decimal import Decimal
-import tempfile
-import shutil
 import time
+import operator
+import queue
+import threading
+from concurrent.futures import Future
 
 from loguru import logger
 import pandas as pd
 
 from config_manager import Config
 
+# Strips currency symbols, thousands separators and spaces in one pass
+_CURRENCY_STRIP = str.maketrans('', '', '$, ')
+
+# Batches allowed to wait for the background writer before producers block
+WRITE_QUEUE_SIZE = 4
+
+# Write buffer for CSV output; one flush per MiB instead of per 8 KB
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+
+# Encoded CSV rows are accumulated up to this size before each write()
+CSV_CHUNK_SIZE = 1 << 18
+
+# Flags for the reusable CSV temp file (O_BINARY only exists on Windows)
+_TEMP_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+# ISO-8601 UTC timestamp written to the TimeStampUTC column
+UTC_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+
+def _to_cents(value: Any) -> int:
+    """Convert a DBF price value to integer cents"""
+    # dbfread already returns numbers for N/F fields; only text needs cleaning
+    if isinstance(value, (int, float, Decimal)):
+        return int(round(float(value) * 100))
+    return int(round(float(str(value).translate(_CURRENCY_STRIP)) * 100))
+
+
+def _to_int(value: Any) -> int:
+    """Convert a DBF quantity value to an integer, truncating fractions"""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, (float, Decimal)):
+        return int(value)
+    return int(float(value))
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as an ISO-8601 string with a 'Z' suffix"""
+    return datetime.now(timezone.utc).strftime(UTC_TIMESTAMP_FORMAT)
+
+
+def _csv_quote(value: str) -> str:
+    """Quote a CSV field only if it contains a delimiter, quote or newline"""
+    if ',' in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _text(value: Any) -> str:
+    """Render a DBF text value, treating None as empty"""
+    return '' if value is None else str(value).strip()
+
+
+def _format_cents(cents: int) -> str:
+    """Format integer cents as a two-decimal price string"""
+    sign = '-' if cents < 0 else ''
+    cents = abs(cents)
+    return f"{sign}{cents // 100}.{cents % 100:02d}"
+
 
 class FixedDataTransformer:
     """Data transformer with fixed field mappings for your DBF structure"""
     
     def __init__(self, config: Config):
         self.config = config
+        self._output_dir = Path(config.CSV_OUTPUT_DIR)
         self.ensure_output_directory()
+        self.setup_mappings()
+        
+        # Hash of each SKU's last written output, used by process_changes
+        # to drop records whose ESL fields have not changed since
+        self._prev_hashes: Dict[str, int] = {}
+        
+        # Background CSV writer, started on first enqueue_batch call
+        self._write_queue = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer_thread = None
         
+        logger.info("Fixed Data Transformer initialized")
+        logger.info(f"Field mappings configured for {len(self.field_mapping)} fields")
+        
+    def setup_mappings(self):
+        """Build the field mappings and per-record lookups that never change"""
         # YOUR ACTUAL DBF FIELD MAPPINGS
         # Based on the CSV header you provided
         self.field_mapping = {
@@ -49,12 +125,23 @@ class FixedDataTransformer:
             'SPRICE': 'SpecialPrice',    # Special/sale price
         }
         
-        logger.info("Fixed Data Transformer initialized")
-        logger.info(f"Field mappings configured for {len(self.field_mapping)} fields")
+        # Summary text for get_field_info; the mapping never changes
+        self._field_info_text = self._build_field_info()
+        
+        # Resolved once here instead of on every transform_record call
+        self.include_description = bool(self.config.INCLUDE_DESCRIPTION)
+        
+        # CSV header row, fixed for the lifetime of the transformer
+        self._csv_headers = ('SKU', 'CurrentPrice', 'StockQuantity', 'TransactionID', 'TimeStampUTC')
+        if self.include_description:
+            self._csv_headers += ('Description',)
+        
+        # Pulls a record's values out in header order with a single C call
+        self._row_values = operator.itemgetter(*self._csv_headers)
         
     def ensure_output_directory(self):
         """Create output directory if it doesn't exist"""
-        Path(self.config.CSV_OUTPUT_DIR).mkdir(parents=True, exist_ok=True)
+        self._output_dir.mkdir(parents=True, exist_ok=True)
         logger.debug(f"Output directory ready: {self.config.CSV_OUTPUT_DIR}")
     
     def transform_record(self, dbf_record: Dict[str, Any], 
@@ -70,7 +157,7 @@ class FixedDataTransformer:
             Dictionary with ESL fields
         """
         if timestamp_utc is None:
-            timestamp_utc = datetime.utcnow().isoformat() + 'Z'
+            timestamp_utc = _utc_timestamp()
         
         # Initialize ESL record with required fields
         esl_record = {
@@ -81,44 +168,54 @@ class FixedDataTransformer:
             'TimeStampUTC': timestamp_utc
         }
         
+        # Each source field is fetched once with .get instead of 'in' + []
+        part_no = dbf_record.get('PART_NO')
+        
         # Map PART_NO to SKU
-        if 'PART_NO' in dbf_record:
-            esl_record['SKU'] = str(dbf_record['PART_NO']).strip()
+        sku = _text(part_no)
+        esl_record['SKU'] = sku
         
-        # Map PRICE1 to CurrentPrice (handle both PRICE1 and SPRICE for special pricing)
-        if 'SPRICE' in dbf_record and dbf_record['SPRICE'] and float(dbf_record['SPRICE']) > 0:
-            # Use special price if available
+        # Map PRICE1 to CurrentPrice (handle both PRICE1 and SPRICE for special pricing).
+        # SPRICE is parsed once and reused for both the check and the output.
+        special_cents = 0
+        special_price = dbf_record.get('SPRICE')
+        if special_price:
             try:
-                price = Decimal(str(dbf_record['SPRICE']).replace(',', ''))
-                esl_record['CurrentPrice'] = f"{price:.2f}"
-            except:
+                special_cents = _to_cents(special_price)
+            except (TypeError, ValueError):
                 pass
-        elif 'PRICE1' in dbf_record:
+        
+        if special_cents > 0:
+            # Use special price if available
+            esl_record['CurrentPrice'] = _format_cents(special_cents)
+        else:
             # Otherwise use regular price
-            try:
-                price = Decimal(str(dbf_record['PRICE1']).replace(',', ''))
-                esl_record['CurrentPrice'] = f"{price:.2f}"
-            except:
-                esl_record['CurrentPrice'] = '0.00'
+            price = dbf_record.get('PRICE1')
+            if price is not None:
+                try:
+                    esl_record['CurrentPrice'] = _format_cents(_to_cents(price))
+                except (TypeError, ValueError):
+                    pass
         
         # Map QTY to StockQuantity
-        if 'QTY' in dbf_record:
+        qty = dbf_record.get('QTY')
+        if qty is not None:
             try:
-                qty = int(float(str(dbf_record['QTY'])))
-                esl_record['StockQuantity'] = str(qty)
-            except:
-                esl_record['StockQuantity'] = '0'
+                esl_record['StockQuantity'] = str(_to_int(qty))
+            except (TypeError, ValueError, OverflowError):
+                pass
         
         # Map INTERNAL to TransactionID (or use PART_NO as fallback)
-        if 'INTERNAL' in dbf_record:
-            esl_record['TransactionID'] = str(dbf_record['INTERNAL']).strip()
-        elif 'PART_NO' in dbf_record:
-            esl_record['TransactionID'] = str(dbf_record['PART_NO']).strip()
+        internal = dbf_record.get('INTERNAL')
+        if internal is not None:
+            esl_record['TransactionID'] = _text(internal)
+        elif part_no is not None:
+            esl_record['TransactionID'] = sku
         
-        # Optional: Add description if needed
-        if self.config.__dict__.get('INCLUDE_DESCRIPTION', False):
-            if 'DESC' in dbf_record:
-                esl_record['Description'] = str(dbf_record['DESC']).strip()
+        # Optional: Add description if needed (always present so every
+        # record carries the full header)
+        if self.include_description:
+            esl_record['Description'] = _text(dbf_record.get('DESC'))
         
         return esl_record
     
@@ -140,81 +237,184 @@ class FixedDataTransformer:
         
         logger.info(f"Transforming {len(dbf_records)} records from {source_file_name}")
         
-        timestamp_utc = datetime.utcnow().isoformat() + 'Z'
-        esl_records = []
+        timestamp_utc = _utc_timestamp()
+        
+        # Work column-wise: each number field is parsed in one vectorized
+        # pass instead of per-record calls in transform_record. Rows holding
+        # a value that pass cannot reproduce exactly go through
+        # transform_record instead
+        out, exact = self._transform_frame(dbf_records, timestamp_utc)
+        transformed = out.to_dict('records')
+        for i in exact.index[~exact]:
+            try:
+                transformed[i] = self.transform_record(dbf_records[i], timestamp_utc)
+            except Exception as e:
+                logger.error(f"Failed to transform record {i}: {e}")
+                transformed[i] = None
+        
+        # Drop failed records and those with an empty SKU
+        esl_records = [record for record in transformed if record and record['SKU']]
+        skipped_empty = sum(1 for record in transformed if record and not record['SKU'])
+        if skipped_empty:
+            logger.info(f"Skipped {skipped_empty} empty-SKU records")
+        
+        logger.info(f"Successfully transformed {len(esl_records)} records")
+        return esl_records
+    
+    def _transform_frame(self, dbf_records: List[Dict[str, Any]],
+                         timestamp_utc: str) -> tuple:
+        """
+        Vectorized transform of DBF records
+        
+        Returns:
+            Tuple of (DataFrame of ESL records in input order, boolean Series
+            marking the rows transformed exactly as transform_record would)
+        """
+        # Built from .get so a missing field stays None, as in transform_record
+        columns = {name: pd.Series([record.get(name) for record in dbf_records], dtype=object)
+                   for name in ('PART_NO', 'SPRICE', 'PRICE1', 'QTY', 'INTERNAL', 'DESC')}
+        exact = pd.Series(True, index=columns['PART_NO'].index)
+        
+        def text_column(name: str) -> pd.Series:
+            # Rendered per value, so a numeric ID column keeps its own
+            # formatting instead of picking up a float '.0'
+            return columns[name].map(_text)
+        
+        def numeric_column(name: str, strip_currency: bool) -> tuple:
+            raw = columns[name]
+            text = raw.astype(str)
+            if strip_currency:
+                text = text.str.translate(_CURRENCY_STRIP)
+            values = pd.to_numeric(text, errors='coerce').astype('float64')
+            # float() accepts forms to_numeric rejects (e.g. '1_000'), and inf
+            # or values beyond 2**53 do not survive the int64 cast exactly
+            present = raw.notna() & (text.str.strip() != '')
+            return values, ~present | (values.abs() < 2 ** 53)
+        
+        sku = text_column('PART_NO')
+        
+        # Special price wins when positive, otherwise fall back to PRICE1
+        special, special_exact = numeric_column('SPRICE', strip_currency=True)
+        regular, regular_exact = numeric_column('PRICE1', strip_currency=True)
+        # QTY is parsed like _to_int: no currency stripping
+        qty, qty_exact = numeric_column('QTY', strip_currency=False)
+        exact &= special_exact & regular_exact & qty_exact
+        
+        price = special.where(special > 0, regular).where(exact, 0).fillna(0)
+        cents = (price * 100).round().astype('int64')
+        qty = qty.where(exact, 0).fillna(0).astype('int64')
+        
+        # INTERNAL is the transaction ID; rows without one fall back to the SKU
+        has_internal = columns['INTERNAL'].map(lambda value: value is not None)
+        transaction_id = text_column('INTERNAL').where(has_internal, sku)
+        
+        out = pd.DataFrame({
+            'SKU': sku,
+            'CurrentPrice': cents.map(_format_cents),
+            'StockQuantity': qty.astype(str),
+            'TransactionID': transaction_id,
+            'TimeStampUTC': timestamp_utc,
+        })
+        
+        if self.include_description:
+            out['Description'] = text_column('DESC')
+        
+        return out, exact
+    
+    def iter_transformed(self, dbf_records: Iterable[Dict[str, Any]],
+                         timestamp_utc: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily transform DBF records, skipping those without a SKU
+        
+        Args:
+            dbf_records: Iterable of DBF record dictionaries
+            timestamp_utc: Optional timestamp shared by every record
+            
+        Yields:
+            Transformed ESL records
+        """
+        # One timestamp for the whole batch
+        if timestamp_utc is None:
+            timestamp_utc = _utc_timestamp()
+        
+        # Counted instead of logged per record; reported once at the end
+        skipped_empty = 0
         
         for i, dbf_record in enumerate(dbf_records):
             try:
                 esl_record = self.transform_record(dbf_record, timestamp_utc)
-                
-                # Skip records with empty SKU
-                if esl_record['SKU']:
-                    esl_records.append(esl_record)
-                else:
-                    logger.debug(f"Skipping record {i}: Empty SKU")
-                    
             except Exception as e:
                 logger.error(f"Failed to transform record {i}: {e}")
                 continue
+            
+            # Skip records with empty SKU
+            if esl_record['SKU']:
+                yield esl_record
+            else:
+                skipped_empty += 1
         
-        logger.info(f"Successfully transformed {len(esl_records)} records")
-        return esl_records
+        if skipped_empty:
+            logger.info(f"Skipped {skipped_empty} empty-SKU records")
     
-    def write_csv_atomic(self, records: List[Dict[str, Any]], 
+    def write_csv_atomic(self, records: Iterable[Dict[str, Any]], 
                         output_file_name: str) -> Optional[str]:
         """
         Write CSV file atomically (write to temp, then rename)
         
         Args:
-            records: List of ESL record dictionaries
+            records: ESL record dictionaries (may be a generator, which is
+                consumed while writing)
             output_file_name: Name for the output file
             
         Returns:
-            Path to the created CSV file
+            Path to the created CSV file, or None if there were no records
         """
-        if not records:
+        if isinstance(records, Sized) and len(records) == 0:
             logger.warning("No records to write to CSV")
             return None
         
-        output_dir = Path(self.config.CSV_OUTPUT_DIR)
-        final_path = output_dir / output_file_name
+        final_path = self._output_dir / output_file_name
         
-        # Create temporary file
-        temp_fd, temp_path = tempfile.mkstemp(
-            suffix='.tmp', 
-            prefix='esl_', 
-            dir=str(output_dir)
-        )
+        # Temporary file in the same directory, so the final rename is atomic.
+        # The name is fixed per process and thread (the background writer may
+        # run alongside the caller), so it is simply truncated and reused
+        # instead of generating a new random name every cycle.
+        temp_path = str(self._output_dir / f".esl_{os.getpid()}_{threading.get_ident()}.tmp")
+        temp_fd = os.open(temp_path, _TEMP_OPEN_FLAGS, 0o644)
         
         try:
-            # Define CSV headers
-            csv_headers = ['SKU', 'CurrentPrice', 'StockQuantity', 'TransactionID', 'TimeStampUTC']
-            
-            # Add optional headers if configured
-            if self.config.__dict__.get('INCLUDE_DESCRIPTION', False):
-                csv_headers.append('Description')
-            
             # Write to temporary file
-            with os.fdopen(temp_fd, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(
-                    csvfile, 
-                    fieldnames=csv_headers,
-                    extrasaction='ignore'  # Ignore extra fields
-                )
+            with os.fdopen(temp_fd, 'wb', buffering=CSV_WRITE_BUFFER_SIZE) as csvfile:
+                csvfile.write((','.join(self._csv_headers) + '\r\n').encode('utf-8'))
                 
-                writer.writeheader()
-                writer.writerows(records)
+                record_count = self._write_rows(csvfile, map(self._row_values, records))
+                
+                # Make sure the data is on disk before the rename publishes it
+                csvfile.flush()
+                os.fsync(csvfile.fileno())
             
-            # Backup existing file if it exists
-            if final_path.exists():
+            if record_count == 0:
+                os.remove(temp_path)
+                logger.warning("No records to write to CSV")
+                return None
+            
+            # Backup existing file if it exists (disabled by PRESERVE_BACKUP_COUNT = 0).
+            # A hard link copies no data and leaves final_path in place, so
+            # readers never see it missing between the backup and the rename.
+            if self.config.PRESERVE_BACKUP_COUNT > 0 and final_path.exists():
                 backup_path = final_path.with_suffix('.bak')
-                shutil.move(str(final_path), str(backup_path))
-                logger.debug(f"Backed up existing file to: {backup_path}")
+                try:
+                    if backup_path.exists():
+                        os.remove(backup_path)
+                    os.link(final_path, backup_path)
+                    logger.debug(f"Backed up existing file to: {backup_path}")
+                except OSError as e:
+                    logger.warning(f"Could not back up {final_path}: {e}")
             
-            # Atomic rename
-            shutil.move(temp_path, str(final_path))
+            # Atomic rename (temp file lives in the same directory)
+            os.replace(temp_path, final_path)
             
-            logger.info(f"CSV file created: {final_path} ({len(records)} records)")
+            logger.info(f"CSV file created: {final_path} ({record_count} records)")
             return str(final_path)
             
         except Exception as e:
@@ -224,6 +424,92 @@ class FixedDataTransformer:
             logger.error(f"Failed to write CSV file: {e}")
             raise
     
+    def _write_rows(self, csvfile, rows: Iterable[tuple]) -> int:
+        """
+        Format and write CSV rows, returning the number written
+        
+        Each row is a tuple of string values in self._csv_headers order.
+        
+        Fixed schema: rows are formatted directly instead of via csv.DictWriter.
+        Rows are encoded straight to bytes and written in CSV_CHUNK_SIZE blocks.
+        
+        Values almost never need quoting, so each row is first joined as-is
+        and checked once; only a row with a stray comma, quote or newline is
+        rebuilt with the free-text columns quoted.
+        """
+        include_description = self.include_description
+        separators = len(self._csv_headers) - 1
+        chunk = bytearray()
+        record_count = 0
+        
+        for values in rows:
+            record_count += 1
+            line = ','.join(values)
+            
+            if (line.count(',') != separators or '"' in line
+                    or '\n' in line or '\r' in line):
+                line = (
+                    f"{_csv_quote(values[0])},{values[1]},{values[2]},"
+                    f"{_csv_quote(values[3])},{values[4]}"
+                )
+                if include_description:
+                    line += ',' + _csv_quote(values[5])
+            chunk += (line + '\r\n').encode('utf-8', 'replace')
+            
+            if len(chunk) >= CSV_CHUNK_SIZE:
+                csvfile.write(chunk)
+                chunk.clear()
+        
+        csvfile.write(chunk)
+        return record_count
+    
+    def enqueue_batch(self, records: List[Dict[str, Any]], output_file_name: str) -> Future:
+        """
+        Queue ESL records to be written by the background writer thread
+        
+        Lets the caller transform the next file while this one is flushed to
+        disk. Blocks when WRITE_QUEUE_SIZE batches are already pending.
+        
+        Args:
+            records: List of ESL record dictionaries
+            output_file_name: Name for the output file
+        
+        Returns:
+            Future resolving to write_csv_atomic's result, or raising its error
+        """
+        return self._submit_write(self.write_csv_atomic, records, output_file_name)
+    
+    def _submit_write(self, write, *args) -> Future:
+        """Hand a write call to the background writer, starting it if needed"""
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(
+                target=self._writer_loop,
+                name="esl-csv-writer",
+                daemon=True
+            )
+            self._writer_thread.start()
+        
+        future = Future()
+        self._write_queue.put((future, write, args))
+        return future
+    
+    def _writer_loop(self):
+        """Consume queued writes and run each one, settling its future"""
+        while True:
+            future, write, args = self._write_queue.get()
+            try:
+                future.set_result(write(*args))
+            except Exception as e:
+                # The write functions have already logged and cleaned up;
+                # the caller sees the error through the future
+                future.set_exception(e)
+            finally:
+                self._write_queue.task_done()
+    
+    def flush(self):
+        """Block until every queued batch has been written"""
+        self._write_queue.join()
+    
     def generate_csv_filename(self, source_file_name: str) -> str:
         """
         Generate timestamped CSV filename
@@ -243,14 +529,15 @@ class FixedDataTransformer:
     
     def process_changes(self, dbf_records: List[Dict[str, Any]], 
                        source_file_name: str,
-                       only_changed: bool = True) -> Optional[str]:
+                       only_changed: bool = False) -> Optional[str]:
         """
         Process DBF records and create CSV output
         
         Args:
             dbf_records: List of DBF records to process
             source_file_name: Name of source DBF file
-            only_changed: If True, only process changed records
+            only_changed: If True, skip records whose ESL fields match what
+                this transformer last wrote for the same SKU
             
         Returns:
             Path to created CSV file or None
@@ -259,23 +546,56 @@ class FixedDataTransformer:
             logger.info("No records to process")
             return None
         
-        # Transform records
-        esl_records = self.transform_batch(dbf_records, source_file_name)
-        
-        if not esl_records:
-            logger.warning("No valid records after transformation")
-            return None
+        logger.info(f"Transforming {len(dbf_records)} records from {source_file_name}")
         
         # Generate output filename with timestamp
         csv_filename = self.generate_csv_filename(source_file_name)
         
-        # Write CSV file
+        # Stream transformed records straight into the CSV writer so the
+        # ESL records are never held in memory all at once
+        esl_records = self.iter_transformed(dbf_records)
+        pending_hashes = {}
+        if only_changed:
+            esl_records = self._iter_changed(esl_records, pending_hashes)
+        
         csv_path = self.write_csv_atomic(esl_records, csv_filename)
         
+        if csv_path is None:
+            logger.warning("No valid records after transformation")
+        else:
+            # Only remember what actually reached disk
+            self._prev_hashes.update(pending_hashes)
+        
         return csv_path
     
+    def _iter_changed(self, esl_records: Iterable[Dict[str, Any]],
+                      pending_hashes: Dict[str, int]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield only records whose ESL fields differ from the last written output
+        
+        Args:
+            esl_records: Transformed ESL records
+            pending_hashes: Filled with the new hash of every yielded SKU
+        
+        Yields:
+            Changed ESL records
+        """
+        prev_hashes = self._prev_hashes
+        
+        for record in esl_records:
+            # Everything except the per-batch timestamp identifies a change
+            record_hash = hash((record['CurrentPrice'], record['StockQuantity'],
+                                record['TransactionID'], record.get('Description')))
+            if prev_hashes.get(record['SKU']) != record_hash:
+                pending_hashes[record['SKU']] = record_hash
+                yield record
+    
     def get_field_info(self):
         """Return information about the field mappings"""
+        return self._field_info_text
+    
+    def _build_field_info(self) -> str:
+        """Render the field mapping summary shown by get_field_info"""
         info = []
         info.append("=" * 60)
         info.append("FIELD MAPPING CONFIGURATION")
@@ -315,18 +635,47 @@ class FixedDataTransformer:
         if not records:
             return None
 
-        output_dir = getattr(self.config, "CSV_OUTPUT_DIR", "output_csv")
-        os.makedirs(output_dir, exist_ok=True)
-        csv_filename = f"{Path(dbf_filename).stem}_{file_type}_{int(time.time())}.csv"
-        csv_path = Path(output_dir) / csv_filename
+        csv_path = self._batch_csv_path(dbf_filename, file_type)
+        return self._write_batch_frame(records, csv_path)
+
+    def enqueue_write_batch(self, records, dbf_filename, file_type):
+        """
+        Queue a batch for the background writer instead of writing it inline.
+        Returns a Future resolving to the path of the CSV file once it is
+        written (or raising the write error), or None if there are no
+        records. The file appears atomically; call flush() to wait for all
+        queued batches.
+        """
+
+        if not records:
+            return None
+
+        csv_path = self._batch_csv_path(dbf_filename, file_type)
+        return self._submit_write(self._write_batch_frame, records, csv_path)
 
-        # Assume all records are dicts with the same keys
-        fieldnames = records[0].keys()
+    def _batch_csv_path(self, dbf_filename, file_type) -> Path:
+        """Output path for a raw record batch"""
+        # Output directory was resolved and created once in __init__
+        csv_filename = f"{Path(dbf_filename).stem}_{file_type}_{int(time.time())}.csv"
+        return self._output_dir / csv_filename
 
-        with open(csv_path, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(records)
+    def _write_batch_frame(self, records, csv_path: Path) -> str:
+        """Write raw records to csv_path via a temp file and atomic rename, returning the path"""
+        temp_path = csv_path.with_name(csv_path.name + '.tmp')
+        try:
+            # Assume all records are dicts with the same keys. csv.DictWriter
+            # writes values as-is (None as an empty field); a DataFrame would
+            # turn an int column holding a blank N field into floats
+            with open(temp_path, "w", newline="", encoding="utf-8") as csvfile:
+                writer = csv.DictWriter(csvfile, fieldnames=records[0].keys())
+                writer.writeheader()
+                writer.writerows(records)
+            os.replace(temp_path, csv_path)
+        except Exception as e:
+            logger.error(f"Failed to write {csv_path.name}: {e}")
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
 
         return str(csv_path)
 
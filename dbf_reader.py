@@ -5,21 +5,160 @@ Reads .dbf files from R-MPOS export directory
 
 import os
 import sys
+import struct
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Sized
+from itertools import islice
 from datetime import datetime
 import json
 
 # Third-party imports
 try:
-    from dbfread import DBF
+    from dbfread import DBF, FieldParser
     from loguru import logger
-    import pandas as pd
 except ImportError as e:
     print(f"Missing required library: {e}")
-    print("Please install: pip install dbfread loguru pandas")
+    print("Please install: pip install dbfread loguru")
     sys.exit(1)
 
+from config_manager import _json_loads
+
+# DBF columns consumed by the ESL transformer; everything else is dropped on read
+USED_FIELDS = frozenset({'PART_NO', 'PRICE1', 'SPRICE', 'QTY', 'INTERNAL', 'DESC'})
+
+# dBASE header: record count, header length and record length at offset 4
+_DBF_HEADER = struct.Struct('<4xIHH20x')
+_DBF_FIELD_DESCRIPTOR = struct.Struct('<11sc4xBB14x')
+
+# Field types stored as text in the record itself (memo types hold block
+# pointers; I, Y, B and the like are binary)
+_DBF_INLINE_TYPES = frozenset(b'CNFDL')
+
+
+def _parse_dbf_layout(data: bytes, wanted: frozenset) -> tuple:
+    """
+    Parse a .dbf header
+    
+    Returns:
+        Tuple of (wanted field names, record struct, record offsets). The
+        struct unpacks the deletion flag followed by the wanted fields.
+    
+    Raises:
+        ValueError: If a wanted field is not an inline text type
+    """
+    record_count, header_length, record_length = _DBF_HEADER.unpack_from(data, 0)
+    
+    # Field descriptors follow the 32-byte header until the 0x0D terminator
+    names = []
+    fmt = '<c'  # deletion flag
+    offset = 32
+    while offset < header_length - 1 and data[offset] != 0x0D:
+        raw_name, field_type, length, _ = _DBF_FIELD_DESCRIPTOR.unpack_from(data, offset)
+        name = raw_name.split(b'\0', 1)[0].decode('ascii').upper()
+        if name in wanted:
+            if field_type[0] not in _DBF_INLINE_TYPES:
+                raise ValueError(f"Field {name} has type {field_type.decode('ascii')}, "
+                                 f"which is not stored inline as text")
+            names.append(name)
+            fmt += f'{length}s'
+        else:
+            fmt += f'{length}x'
+        offset += _DBF_FIELD_DESCRIPTOR.size
+    
+    # Guard against a header that claims more records than were written
+    record_count = min(record_count, (len(data) - header_length) // record_length)
+    offsets = range(header_length, header_length + record_count * record_length, record_length)
+    
+    return names, struct.Struct(fmt), offsets
+
+
+def iter_dbf_records(file_path: Path, field_names: Iterable[str],
+                     encoding: str = 'latin-1') -> Iterator[Dict[str, str]]:
+    """
+    Read selected columns straight from the bytes of a .dbf file
+    
+    The file is read in one call and closed, so no handle stays open on a
+    table the POS may be writing. The header is parsed once into a
+    precompiled struct that skips unwanted columns, so each record is a
+    single unpack_from with no per-record object construction. Values are
+    returned as stripped text. Deleted records are skipped.
+    
+    Args:
+        file_path: Path to the .dbf file
+        field_names: Columns to return (missing ones are ignored)
+        encoding: Text encoding of the character fields
+    
+    Yields:
+        Dictionaries of field name -> text value
+    
+    Raises:
+        ValueError: If a requested field is not an inline text type
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    names, record_struct, offsets = _parse_dbf_layout(data, frozenset(field_names))
+    
+    for position in offsets:
+        deleted, *values = record_struct.unpack_from(data, position)
+        if deleted == b'*':
+            continue
+        yield {name: value.decode(encoding).strip() for name, value in zip(names, values)}
+
+
+def iter_used_fields(file_path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Read the USED_FIELDS columns of a .dbf file
+    
+    Uses iter_dbf_records, falling back to dbfread when one of the fields
+    is not stored inline as text. Both paths yield stripped text.
+    
+    Args:
+        file_path: Path to the .dbf file
+    
+    Yields:
+        Dictionaries containing the records
+    """
+    try:
+        records = iter_dbf_records(file_path, USED_FIELDS)
+        first = next(records, None)
+    except ValueError as e:
+        logger.debug("{}; reading {} with dbfread", e, file_path)
+        records = _iter_dbf_table(file_path)
+        first = next(records, None)
+    
+    if first is not None:
+        yield first
+        yield from records
+
+
+class _TextFieldParser(FieldParser):
+    """dbfread parser returning every value as stripped text, like iter_dbf_records"""
+    
+    def parse(self, field, data):
+        if ord(field.type) in _DBF_INLINE_TYPES:
+            return self.decode_text(data).strip()
+        
+        # Memo and binary types: parse, then render as text
+        value = super().parse(field, data)
+        if value is None:
+            return ""
+        if isinstance(value, bytes):
+            value = self.decode_text(value)
+        return str(value).strip()
+
+
+def _iter_dbf_table(file_path: Path) -> Iterator[Dict[str, str]]:
+    """Read the USED_FIELDS columns through dbfread (handles memo files)"""
+    # Open in read-only mode to prevent corruption; keep field names
+    # uppercase so downstream lookups need no per-record normalization
+    table = DBF(str(file_path), load=False, encoding='latin-1', lowernames=False,
+                parserclass=_TextFieldParser)
+    used_fields = [name for name in table.field_names if name in USED_FIELDS]
+    
+    for record in table:
+        yield {key: record[key] for key in used_fields}
+
+
 # Configuration
 class Config:
     """Configuration settings for the middleware"""
@@ -42,10 +181,10 @@ class Config:
         """Load configuration from JSON file if it exists"""
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
-                    for key, value in config_data.items():
-                        setattr(self, key, value)
+                with open(self.config_file, 'rb') as f:
+                    config_data = _json_loads(f.read())
+                for key, value in config_data.items():
+                    setattr(self, key, value)
                 logger.info(f"Configuration loaded from {self.config_file}")
             except Exception as e:
                 logger.warning(f"Could not load config file: {e}. Using defaults.")
@@ -118,63 +257,81 @@ class DBFReader:
         Returns:
             List of dictionaries containing the records
         """
-        records = []
+        records = list(self.iter_dbf_file(file_path, limit))
+        logger.info(f"Successfully read {len(records)} records from {file_path}")
+        return records
+    
+    def iter_dbf_file(self, file_path: Path, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily read a .dbf file, yielding one cleaned record at a time
+        
+        Every field is returned; strings are stripped and None becomes "".
+        
+        Args:
+            file_path: Path to the .dbf file
+            limit: Maximum number of records to read (None for all)
+        
+        Yields:
+            Dictionaries containing the records
+        """
         try:
             logger.info(f"Reading DBF file: {file_path}")
             
             # Open in read-only mode to prevent corruption
             table = DBF(str(file_path), load=False, encoding='latin-1')
             
-            # Read records
-            for i, record in enumerate(table):
-                if limit and i >= limit:
-                    break
-                    
-                # Convert record to dictionary
-                record_dict = dict(record)
-                
+            for record in islice(table, limit or None):
                 # Clean up the data (remove None values, strip strings)
-                cleaned_record = {}
-                for key, value in record_dict.items():
-                    if value is not None:
-                        if isinstance(value, str):
-                            cleaned_record[key] = value.strip()
-                        else:
-                            cleaned_record[key] = value
-                    else:
-                        cleaned_record[key] = ""
-                
-                records.append(cleaned_record)
-            
-            logger.info(f"Successfully read {len(records)} records from {file_path}")
+                yield {key: "" if value is None else value.strip() if isinstance(value, str) else value
+                       for key, value in record.items()}
             
         except Exception as e:
             logger.error(f"Error reading DBF file {file_path}: {e}")
             raise
+    
+    def read_used_fields(self, file_path: Path, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Read only the USED_FIELDS columns of a .dbf file
+        
+        Cheaper than read_dbf_file when the records go straight to the ESL
+        transformer (see iter_used_fields).
         
+        Args:
+            file_path: Path to the .dbf file
+            limit: Maximum number of records to read (None for all)
+        
+        Returns:
+            List of dictionaries containing the records
+        """
+        try:
+            records = list(islice(iter_used_fields(file_path), limit or None))
+        except Exception as e:
+            logger.error(f"Error reading DBF file {file_path}: {e}")
+            raise
+        
+        logger.info(f"Successfully read {len(records)} records from {file_path}")
         return records
     
-    def display_sample_data(self, records: List[Dict[str, Any]], sample_size: int = 10):
-        """Display sample data from the records"""
-        if not records:
+    def display_sample_data(self, records: Iterable[Dict[str, Any]], sample_size: int = 10):
+        """Display sample data from the records (a list or a lazy iterator)"""
+        # Only the sample is materialized, so iter_dbf_file output works too
+        sample_records = list(islice(records, sample_size))
+        
+        if not sample_records:
             logger.warning("No records to display")
             return
         
-        # Take sample
-        sample_records = records[:sample_size]
-        
-        # Convert to pandas DataFrame for better display
-        df = pd.DataFrame(sample_records)
-        
         print("\n" + "=" * 80)
-        print(f"SAMPLE DATA (First {min(sample_size, len(records))} records)")
+        print(f"SAMPLE DATA (First {len(sample_records)} records)")
         print("=" * 80)
         
-        # Display DataFrame info
-        print(f"\nTotal Records: {len(records)}")
-        print(f"Columns: {', '.join(df.columns.tolist())}")
+        # Display column info (types taken from the first record)
+        if isinstance(records, Sized):
+            print(f"\nTotal Records: {len(records)}")
+        print(f"Columns: {', '.join(sample_records[0].keys())}")
         print(f"\nData Types:")
-        print(df.dtypes)
+        for key, value in sample_records[0].items():
+            print(f"  {key:20s}: {type(value).__name__}")
         
         print(f"\nSample Records:")
         print("-" * 80)
@@ -184,7 +341,7 @@ class DBFReader:
                 print(f"  {key:20s}: {value}")
         
         # Also log the sample
-        logger.info(f"Sample data displayed: {sample_size} records shown")
+        logger.info(f"Sample data displayed: {len(sample_records)} records shown")
         
     def get_dbf_schema(self, file_path: Path) -> Dict[str, str]:
         """Get the schema (field names and types) of a DBF file"""
@@ -5,15 +5,22 @@ Handles DBF files with accompanying memo files (.FPT, .DBT, .MPT)
 
 import os
 import sys
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
+from itertools import islice
+from operator import itemgetter
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+import csv
 import json
 import struct
 
 # Third-party imports
 try:
     from dbfread import DBF
+    from dbfread.codepages import guess_encoding
     from loguru import logger
     import pandas as pd
 except ImportError as e:
@@ -23,6 +30,193 @@ except ImportError as e:
 
 from config_manager import Config
 
+# orjson is an optional speedup; fall back to the stdlib encoder when missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyarrow is only needed for Parquet export
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+# Write buffer for memo exports
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Records per Parquet row group in export_parquet
+PARQUET_BATCH_SIZE = 65536
+
+# Rows handed to csv.writer.writerows at a time in export_csv
+CSV_EXPORT_CHUNK_SIZE = 4096
+
+# Records read per chunk when counting live records in analyze_dbf_structure
+COUNT_CHUNK_RECORDS = 4096
+
+# Entries kept per EnhancedDBFReader lookup cache
+READER_CACHE_SIZE = 256
+
+# Cache miss marker for lookups whose cached value may be None
+_NOT_CACHED = object()
+
+
+def _json_bytes(data: Any) -> bytes:
+    """Serialize one compact JSON value"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _json_line(data: Any) -> bytes:
+    """Serialize one compact JSON object followed by a newline"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8') + b'\n'
+
+
+# pandas inferred types of object columns that may contain text or bytes
+_TEXT_INFERRED_TYPES = frozenset({'string', 'bytes', 'mixed', 'mixed-integer', 'empty'})
+
+
+def _index_by_stem_ext(names: Iterable[str]) -> Dict[Tuple[str, str], str]:
+    """Map lowercased (stem, ext) -> file name, for case-insensitive companion lookup"""
+    files_by_stem_ext = {}
+    for name in names:
+        stem, ext = os.path.splitext(name)
+        files_by_stem_ext[(stem.lower(), ext.lower())] = name
+    return files_by_stem_ext
+
+
+def _memo_header_issues(memo_ext: str, header: bytes, file_size: int) -> List[str]:
+    """
+    Check a memo file's header against its size
+    
+    The header holds the next free block number and the block size, so
+    a file shorter than the blocks in use has been truncated.
+    
+    Args:
+        memo_ext: Memo file extension (e.g. '.FPT')
+        header: First 32 bytes of the memo file
+        file_size: Memo file size in bytes
+        
+    Returns:
+        List of issues (empty if the header is consistent)
+    """
+    memo_ext = memo_ext.upper()
+    if memo_ext in ('.FPT', '.MPT'):
+        # FoxPro: big-endian next free block at 0, block size at 6
+        next_block, block_size = struct.unpack_from('>I2xH', header)
+    elif memo_ext == '.DBT':
+        # dBase: little-endian next free block at 0; dBase IV stores the
+        # block size at 20, dBase III leaves it zero and uses 512
+        next_block, = struct.unpack_from('<I', header)
+        block_size = struct.unpack_from('<H', header, 20)[0] or 512
+    else:
+        return []
+    
+    if block_size == 0:
+        return ["Memo file header has a zero block size"]
+    
+    # The last block in use may be partially written, so allow for it
+    if next_block and file_size < (next_block - 1) * block_size:
+        return [f"Memo file appears truncated: header points to block {next_block} "
+                f"of {block_size} bytes but the file is {file_size:,} bytes"]
+    
+    return []
+
+
+def _header_encoding(language_driver: int) -> str:
+    """Code page named by a DBF header's language driver byte (as dbfread guesses it)"""
+    try:
+        return guess_encoding(language_driver)
+    except LookupError:
+        return 'ascii'
+
+
+def _count_live_records(file_path: Path, header) -> int:
+    """
+    Count the records len(DBF) would (not deleted, up to the EOF marker)
+    
+    Reads whole records in COUNT_CHUNK_RECORDS chunks and stops after the
+    header's record count, so a large table is never held in memory and
+    bytes appended past the last record are not counted.
+    """
+    live = 0
+    remaining = header.numrecords
+    with open(file_path, 'rb') as f:
+        f.seek(header.headerlen)
+        while remaining > 0:
+            chunk = f.read(min(remaining, COUNT_CHUNK_RECORDS) * header.recordlen)
+            if not chunk:
+                break
+            # First byte of each record is its deletion flag
+            flags = chunk[::header.recordlen]
+            end = flags.find(b'\x1a')
+            if end >= 0:
+                return live + flags[:end].count(b' ')
+            live += flags.count(b' ')
+            remaining -= len(flags)
+    return live
+
+
+def _arrow_field_type(field) -> 'pa.DataType':
+    """Arrow type for the values dbfread produces for a DBF field"""
+    if field.type == 'N':
+        # dbfread returns ints for whole-number fields, floats otherwise
+        return pa.float64() if field.decimal_count else pa.int64()
+    if field.type in ('F', 'O'):
+        return pa.float64()
+    if field.type in ('I', '+'):
+        return pa.int64()
+    if field.type == 'L':
+        return pa.bool_()
+    if field.type == 'D':
+        return pa.date32()
+    if field.type in ('T', '@'):
+        return pa.timestamp('ms')
+    if field.type == 'Y':
+        return pa.decimal128(19, 4)
+    if field.type == 'B':
+        # Visual FoxPro stores an 8-byte double; dBASE a 10-byte binary memo pointer
+        return pa.float64() if field.length == 8 else pa.binary()
+    if field.type == 'M':
+        # Text memo (dbfread decodes it)
+        return pa.string()
+    if field.type in ('G', 'P', '0'):
+        return pa.binary()
+    return pa.string()
+
+
+class LRUCache(OrderedDict):
+    """Dictionary that evicts its least recently used entries beyond maxsize"""
+    
+    def __init__(self, maxsize: int = READER_CACHE_SIZE):
+        super().__init__()
+        self.maxsize = maxsize
+        # The middleware reads several DBF files from worker threads
+        self._lock = threading.Lock()
+    
+    def __getitem__(self, key):
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+    
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            if len(self) > self.maxsize:
+                self.popitem(last=False)
+
 
 class MemoFieldInfo:
     """Information about memo fields in DBF files"""
@@ -35,8 +229,11 @@ class MemoFieldInfo:
         '.SMT': 'dBase IV',     # dBase IV system memo
     }
     
+    # Lowercased memo extensions, in lookup priority order
+    MEMO_EXTENSIONS_LOWER = tuple(ext.lower() for ext in MEMO_EXTENSIONS)
+    
     # Field types that typically use memo files
-    MEMO_FIELD_TYPES = ['M', 'G', 'P', 'B']  # Memo, General, Picture, Binary
+    MEMO_FIELD_TYPES = frozenset({'M', 'G', 'P', 'B'})  # Memo, General, Picture, Binary
 
 
 class EnhancedDBFReader:
@@ -46,7 +243,10 @@ class EnhancedDBFReader:
         self.config = config
         self.setup_logging()
         self.ensure_directories()
-        self.memo_cache = {}  # Cache for memo file handles
+        self.memo_cache = LRUCache()  # DBF path -> memo path (or None), refreshed by find_dbf_files
+        self._dir_listings = LRUCache()  # directory -> (mtime_ns, {(stem, ext) lowercased: file name})
+        self._table_cache = LRUCache()  # DBF path -> (mtime_ns, dbfread table)
+        self._structure_cache = LRUCache()  # DBF path -> (mtime_ns, analyze_dbf_structure result)
         
     def setup_logging(self):
         """Configure logging with loguru"""
@@ -70,31 +270,67 @@ class EnhancedDBFReader:
             Path(dir_path).mkdir(parents=True, exist_ok=True)
             logger.debug(f"Ensured directory exists: {dir_path}")
     
-    def find_dbf_files(self) -> List[Tuple[Path, Optional[Path]]]:
+    def find_dbf_files(self, recursive: bool = False) -> List[Tuple[Path, Optional[Path]]]:
         """
         Find all DBF files and their associated memo files
         
+        Args:
+            recursive: Also search subdirectories (hidden ones are skipped)
+        
         Returns:
             List of tuples (dbf_path, memo_path or None)
         """
         dbf_dir = Path(self.config.DBF_INPUT_DIR)
-        dbf_files = list(dbf_dir.glob("*.dbf")) + list(dbf_dir.glob("*.DBF"))
+        
+        # One directory read instead of two globs plus up to 8 exists()
+        # checks per DBF; memo companions are resolved by dict lookup
+        if recursive:
+            listings = list(self._walk_directories(dbf_dir))
+        else:
+            try:
+                listings = [(dbf_dir, self._list_directory(str(dbf_dir), refresh=True))]
+            except FileNotFoundError:
+                listings = []
+        
+        if not listings:
+            logger.warning(f"DBF input directory not found: {dbf_dir}")
         
         result = []
-        for dbf_file in dbf_files:
-            memo_file = self.find_memo_file(dbf_file)
-            result.append((dbf_file, memo_file))
-            
-            if memo_file:
-                logger.info(f"Found DBF with memo: {dbf_file.name} -> {memo_file.name}")
-            else:
-                logger.info(f"Found standalone DBF: {dbf_file.name}")
+        for directory, files_by_stem_ext in listings:
+            for (stem, ext), name in sorted(files_by_stem_ext.items()):
+                if ext != '.dbf':
+                    continue
+                
+                dbf_file = directory / name
+                memo_name = self._memo_name(files_by_stem_ext, stem)
+                memo_file = directory / memo_name if memo_name else None
+                self.memo_cache[str(dbf_file)] = memo_file
+                result.append((dbf_file, memo_file))
+                
+                if memo_file:
+                    logger.info(f"Found DBF with memo: {dbf_file.name} -> {memo_file.name}")
+                else:
+                    logger.info(f"Found standalone DBF: {dbf_file.name}")
         
         logger.info(f"Total: {len(result)} DBF file(s), "
                    f"{sum(1 for _, m in result if m)} with memo files")
         
         return result
     
+    def _walk_directories(self, top: Path) -> Iterator[Tuple[Path, Dict[Tuple[str, str], str]]]:
+        """
+        Walk top and its subdirectories in sorted order
+        
+        os.walk lists each directory with a single scandir; hidden
+        directories are pruned before they are descended into.
+        
+        Yields:
+            Tuples of (directory, lowercased (stem, ext) -> file name)
+        """
+        for root, dirs, files in os.walk(top):
+            dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+            yield Path(root), _index_by_stem_ext(files)
+    
     def find_memo_file(self, dbf_path: Path) -> Optional[Path]:
         """
         Find the memo file associated with a DBF file
@@ -105,47 +341,147 @@ class EnhancedDBFReader:
         Returns:
             Path to memo file if found, None otherwise
         """
-        base_name = dbf_path.stem
+        # Resolved at most once per DBF; find_dbf_files refreshes the cache
+        # on every discovery pass so added/removed memo files are picked up
+        cache_key = str(dbf_path)
+        memo_path = self.memo_cache.get(cache_key, _NOT_CACHED)
+        if memo_path is not _NOT_CACHED:
+            return memo_path
+        
+        memo_path = self._locate_memo_file(dbf_path)
+        self.memo_cache[cache_key] = memo_path
+        return memo_path
+    
+    def _locate_memo_file(self, dbf_path: Path) -> Optional[Path]:
+        """Look up the memo file next to dbf_path in the cached directory listing"""
+        # Plain string ops; a Path is only built for a memo that exists
+        directory, file_name = os.path.split(os.fspath(dbf_path))
+        directory = directory or os.curdir
+        try:
+            files_by_stem_ext = self._list_directory(directory)
+        except FileNotFoundError:
+            return None
+        
+        memo_name = self._memo_name(files_by_stem_ext, os.path.splitext(file_name)[0].lower())
+        if memo_name is None:
+            return None
+        
+        logger.opt(lazy=True).debug(
+            "Found {} memo file: {}",
+            lambda: MemoFieldInfo.MEMO_EXTENSIONS.get(os.path.splitext(memo_name)[1].upper()),
+            lambda: memo_name,
+        )
+        return Path(directory, memo_name)
+    
+    def _list_directory(self, directory: str, refresh: bool = False) -> Dict[Tuple[str, str], str]:
+        """
+        List a directory as lowercased (stem, ext) -> file name
+        
+        The listing is reused until the directory's mtime changes, so
+        resolving memo files for many DBFs in one directory costs one
+        stat() each instead of a probe per extension and case.
+        
+        Args:
+            directory: Directory to list
+            refresh: Rescan even if the cached listing looks current
+            
+        Returns:
+            Dictionary of (stem, ext) lowercased -> file name
+            
+        Raises:
+            FileNotFoundError: If the directory does not exist
+        """
+        mtime_ns = os.stat(directory).st_mtime_ns
+        cached = self._dir_listings.get(directory)
+        if cached is not None and cached[0] == mtime_ns and not refresh:
+            return cached[1]
         
-        # Check for memo files with common extensions
-        for ext, memo_type in MemoFieldInfo.MEMO_EXTENSIONS.items():
-            # Try both lowercase and uppercase extensions
-            for memo_ext in [ext.lower(), ext.upper()]:
-                memo_path = dbf_path.parent / f"{base_name}{memo_ext}"
-                if memo_path.exists():
-                    logger.debug(f"Found {memo_type} memo file: {memo_path.name}")
-                    return memo_path
+        with os.scandir(directory) as entries:
+            files_by_stem_ext = _index_by_stem_ext(entry.name for entry in entries if entry.is_file())
         
+        self._dir_listings[directory] = (mtime_ns, files_by_stem_ext)
+        return files_by_stem_ext
+    
+    @staticmethod
+    def _memo_name(files_by_stem_ext: Dict[Tuple[str, str], str], stem: str) -> Optional[str]:
+        """Name of the first memo file for a lowercased stem, by extension priority"""
+        for memo_ext in MemoFieldInfo.MEMO_EXTENSIONS_LOWER:
+            memo_name = files_by_stem_ext.get((stem, memo_ext))
+            if memo_name:
+                return memo_name
         return None
     
-    def analyze_dbf_structure(self, file_path: Path) -> Dict[str, Any]:
+    def _open_table(self, file_path: Path, mtime_ns: Optional[int] = None) -> DBF:
+        """
+        Open a DBF file with dbfread, reusing the parsed header while the file is unchanged
+        
+        Args:
+            file_path: Path to the DBF file
+            mtime_ns: Modification time of file_path, if the caller already has it
+            
+        Returns:
+            Unloaded dbfread table (latin-1, uppercase field names)
+        """
+        cache_key = str(file_path)
+        if mtime_ns is None:
+            mtime_ns = os.stat(cache_key).st_mtime_ns
+        
+        cached = self._table_cache.get(cache_key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        
+        # Field names are kept uppercase (lowernames=False) so the
+        # transformer can look them up directly without normalizing
+        # keys per record
+        table = DBF(cache_key, load=False, encoding='latin-1', lowernames=False)
+        self._table_cache[cache_key] = (mtime_ns, table)
+        return table
+    
+    def analyze_dbf_structure(self, file_path: Path,
+                              file_stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
         """
         Analyze DBF file structure including memo fields
         
         Args:
             file_path: Path to the DBF file
+            file_stat: stat() result for file_path, if the caller already has it
             
         Returns:
             Dictionary with file structure information
         """
+        if file_stat is None:
+            file_stat = file_path.stat()
+        
+        cache_key = str(file_path)
+        cached = self._structure_cache.get(cache_key)
+        if cached is not None and cached[0] == file_stat.st_mtime_ns:
+            return cached[1]
+        
         structure = {
             'file_name': file_path.name,
-            'file_size': file_path.stat().st_size,
+            'file_size': file_stat.st_size,
             'has_memo': False,
             'memo_file': None,
             'memo_fields': [],
             'regular_fields': [],
             'total_records': 0,
+            'header_records': 0,
             'encoding': None,
             'version': None
         }
         
         try:
-            # Open DBF to analyze structure
-            table = DBF(str(file_path), load=False)
+            # Open DBF to analyze structure (shared with the record readers)
+            table = self._open_table(file_path, file_stat.st_mtime_ns)
             
-            structure['total_records'] = len(table)
-            structure['encoding'] = table.encoding
+            # Version and code page straight from the header dbfread has
+            # already parsed. The header's record count includes deleted
+            # records, so the live count comes from one read of the deletion
+            # flags instead of len(table), which reads them a byte at a time
+            structure['total_records'] = _count_live_records(file_path, table.header)
+            structure['header_records'] = table.header.numrecords
+            structure['version'] = table.header.dbversion
+            structure['encoding'] = _header_encoding(table.header.language_driver)
             
             # Check for memo file
             memo_file = self.find_memo_file(file_path)
@@ -165,7 +501,7 @@ class EnhancedDBFReader:
                 # Check if this is a memo field
                 if field.type in MemoFieldInfo.MEMO_FIELD_TYPES:
                     structure['memo_fields'].append(field_info)
-                    logger.debug(f"Memo field detected: {field.name} (type: {field.type})")
+                    logger.debug("Memo field detected: {} (type: {})", field.name, field.type)
                 else:
                     structure['regular_fields'].append(field_info)
             
@@ -174,6 +510,8 @@ class EnhancedDBFReader:
             logger.info(f"  Regular fields: {len(structure['regular_fields'])}")
             logger.info(f"  Memo fields: {len(structure['memo_fields'])}")
             
+            self._structure_cache[cache_key] = (file_stat.st_mtime_ns, structure)
+            
         except Exception as e:
             logger.error(f"Error analyzing DBF structure: {e}")
             
@@ -193,51 +531,124 @@ class EnhancedDBFReader:
         Returns:
             List of dictionaries containing the records
         """
-        records = []
+        records = list(self.iter_dbf_file(file_path, limit, include_memo))
+        logger.info(f"Successfully read {len(records)} records from {file_path}")
+        return records
+    
+    def iter_dbf_file(self, file_path: Path,
+                      limit: Optional[int] = None,
+                      include_memo: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily read a DBF file with memo field support, one record at a time
         
+        Args:
+            file_path: Path to the DBF file
+            limit: Maximum number of records to read
+            include_memo: Whether to include memo field contents
+            
+        Yields:
+            Cleaned record dictionaries
+        """
         try:
             logger.info(f"Reading DBF file: {file_path}")
             
             # Check for memo file
             memo_file = self.find_memo_file(file_path) if include_memo else None
             
-            # Configure DBF reader based on memo file presence
             if memo_file:
                 logger.info(f"Reading with memo file: {memo_file.name}")
-                # dbfread automatically handles memo files when they exist
-                table = DBF(str(file_path), load=False, encoding='latin-1')
-            else:
-                table = DBF(str(file_path), load=False, encoding='latin-1')
+            
+            # dbfread automatically handles memo files when they exist
+            table = self._open_table(file_path)
+            
+            # Local names for the per-record hot loop
+            _bytes = bytes
+            _str = str
+            _type = type
+            _isinstance = isinstance
             
             # Read records
             for i, record in enumerate(table):
                 if limit and i >= limit:
                     break
                 
-                # Convert record to dictionary
-                record_dict = dict(record)
-                
-                # Clean up the data
-                cleaned_record = self.clean_record(record_dict)
+                # Same cleaning as clean_record, inlined: None -> "", text
+                # stripped, bytes (including binary memos, a bytes
+                # subclass) decoded
+                cleaned_record = {
+                    key: ("" if value is None
+                          else value.strip() if _type(value) is _str
+                          else value.decode('utf-8', 'replace').strip() if _isinstance(value, _bytes)
+                          else value)
+                    for key, value in record.items()
+                }
                 
                 # Add metadata
                 cleaned_record['_source_file'] = file_path.name
                 cleaned_record['_has_memo'] = memo_file is not None
                 cleaned_record['_record_index'] = i
                 
-                records.append(cleaned_record)
-            
-            logger.info(f"Successfully read {len(records)} records from {file_path}")
-            
-            # Log sample of memo field content if present
-            if memo_file and records:
-                self.log_memo_field_sample(records[0])
+                # Log sample of memo field content if present
+                if memo_file and i == 0:
+                    self.log_memo_field_sample(cleaned_record)
+                
+                yield cleaned_record
             
         except Exception as e:
             logger.error(f"Error reading DBF file {file_path}: {e}")
             raise
+    
+    def read_dbf_file_df(self, file_path: Path,
+                         limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Read a DBF file into a DataFrame, cleaned column-wise
         
-        return records
+        Applies the same cleaning as clean_record (bytes decoded, text
+        stripped, None -> ""), but as one vectorized pass per column
+        instead of a Python loop over every field of every record.
+        
+        Args:
+            file_path: Path to the DBF file
+            limit: Maximum number of records to read
+            
+        Returns:
+            DataFrame with one column per DBF field plus the
+            _source_file, _has_memo and _record_index metadata columns
+        """
+        logger.info(f"Reading DBF file: {file_path}")
+        
+        memo_file = self.find_memo_file(file_path)
+        table = self._open_table(file_path)
+        # object dtype keeps dbfread's Python values (ints stay ints with gaps)
+        df = pd.DataFrame(list(islice(table, limit or None)), columns=table.field_names, dtype=object)
+        
+        for column in df.columns[df.dtypes == object]:
+            # Numeric/date columns hold no text; skip them without scanning
+            if pd.api.types.infer_dtype(df[column], skipna=True) not in _TEXT_INFERRED_TYPES:
+                continue
+            
+            values = df[column]
+            kinds = values.map(type)
+            
+            is_bytes = kinds.isin((bytes, bytearray))
+            if is_bytes.any():
+                values = values.mask(is_bytes, values[is_bytes].str.decode('utf-8', 'replace'))
+            
+            is_text = is_bytes | kinds.eq(str)
+            if is_text.any():
+                values = values.mask(is_text, values[is_text].str.strip())
+            
+            df[column] = values
+        
+        df = df.fillna('')
+        
+        # Add metadata
+        df['_source_file'] = file_path.name
+        df['_has_memo'] = memo_file is not None
+        df['_record_index'] = range(len(df))
+        
+        logger.info(f"Successfully read {len(df)} records from {file_path}")
+        return df
     
     def clean_record(self, record_dict: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -249,69 +660,153 @@ class EnhancedDBFReader:
         Returns:
             Cleaned record dictionary
         """
-        cleaned = {}
-        
-        for key, value in record_dict.items():
-            if value is None:
-                cleaned[key] = ""
-            elif isinstance(value, bytes):
-                # Handle binary memo data
-                try:
-                    # Try to decode as text
-                    cleaned[key] = value.decode('utf-8', errors='replace').strip()
-                except:
-                    # Store as hex string if binary
-                    cleaned[key] = value.hex()
-                    logger.debug(f"Binary memo field {key} converted to hex")
-            elif isinstance(value, str):
-                # Clean text, including memo text
-                cleaned[key] = value.strip()
-                # Truncate very long memo fields for display
-                if len(cleaned[key]) > 1000:
-                    logger.debug(f"Memo field {key} contains {len(cleaned[key])} characters")
-            else:
-                cleaned[key] = value
-        
-        return cleaned
+        # Built in one comprehension so the dict is sized once; binary memo
+        # data is decoded with errors='replace', which cannot fail
+        return {
+            key: ("" if value is None
+                  else value.strip() if isinstance(value, str)
+                  else value.decode('utf-8', errors='replace').strip() if isinstance(value, bytes)
+                  else value)
+            for key, value in record_dict.items()
+        }
     
     def log_memo_field_sample(self, record: Dict[str, Any]):
         """Log a sample of memo field content for debugging"""
-        for key, value in record.items():
-            if isinstance(value, str) and len(value) > 100:
-                sample = value[:100] + "..." if len(value) > 100 else value
-                logger.debug(f"Memo field '{key}' sample: {sample}")
+        memo_keys = [key for key, value in record.items()
+                     if isinstance(value, str) and len(value) > 100]
+        if not memo_keys:
+            return
+        
+        # One log line for all memo fields; the samples are only sliced
+        # and joined if a DEBUG sink is listening
+        logger.opt(lazy=True).debug(
+            "Memo field samples: {}",
+            lambda: "; ".join(f"'{key}': {record[key][:100]}..." for key in memo_keys)
+        )
     
-    def export_memo_fields(self, records: List[Dict[str, Any]], 
-                          output_file: str) -> None:
+    def export_memo_fields(self, records: Iterable[Dict[str, Any]], 
+                          output_file: str, ndjson: bool = False) -> None:
         """
         Export memo field contents to a separate file for analysis
         
+        The file is a JSON array, written one element at a time so the export
+        never holds more than one record in memory.
+        
         Args:
-            records: List of records containing memo fields
+            records: Records containing memo fields (may be a generator)
             output_file: Path to output file
+            ndjson: Write newline-delimited JSON (one object per line)
+                instead of an array
+        """
+        output_path = Path(self.config.CSV_OUTPUT_DIR) / output_file
+        exported = 0
+        
+        with open(output_path, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+            for record in records:
+                memo_record = {
+                    '_record_index': record.get('_record_index', 0)
+                }
+                
+                # Extract memo fields (typically long text fields)
+                for key, value in record.items():
+                    if isinstance(value, str) and len(value) > 255:
+                        memo_record[key] = value
+                
+                if len(memo_record) > 1:  # Has memo data besides index
+                    if ndjson:
+                        f.write(_json_line(memo_record))
+                    else:
+                        f.write(b',\n' if exported else b'[\n')
+                        f.write(_json_bytes(memo_record))
+                    exported += 1
+            
+            if exported and not ndjson:
+                f.write(b'\n]\n')
+        
+        if exported:
+            logger.info(f"Exported {exported} records with memo fields to {output_path}")
+        else:
+            output_path.unlink()
+    
+    def export_csv(self, file_path: Path, output_file: str) -> int:
+        """
+        Stream every field of a DBF file (memo contents included) to CSV
+        
+        Records go straight from the dbfread iterator to csv.writer as
+        value tuples (no DictWriter key lookups), written with writerows
+        in chunks of CSV_EXPORT_CHUNK_SIZE rows.
+        
+        Args:
+            file_path: Path to the DBF file
+            output_file: CSV file name in the output directory
+            
+        Returns:
+            Number of records written
         """
-        memo_data = []
+        table = self._open_table(file_path)
+        output_path = Path(self.config.CSV_OUTPUT_DIR) / output_file
+        exported = 0
         
-        for record in records:
-            memo_record = {
-                '_record_index': record.get('_record_index', 0)
-            }
+        with open(output_path, 'w', newline='', encoding='utf-8',
+                  buffering=EXPORT_BUFFER_SIZE) as f:
+            field_names = table.field_names
+            writer = csv.writer(f)
+            writer.writerow(field_names)
             
-            # Extract memo fields (typically long text fields)
-            for key, value in record.items():
-                if isinstance(value, str) and len(value) > 255:
-                    memo_record[key] = value
+            # itemgetter returns a bare value rather than a tuple for one field
+            if len(field_names) == 1:
+                name = field_names[0]
+                rows = ((record[name],) for record in table)
+            else:
+                rows = map(itemgetter(*field_names), table)
             
-            if len(memo_record) > 1:  # Has memo data besides index
-                memo_data.append(memo_record)
+            for chunk in iter(lambda: list(islice(rows, CSV_EXPORT_CHUNK_SIZE)), []):
+                writer.writerows(chunk)
+                exported += len(chunk)
+        
+        logger.info(f"Exported {exported} records from {file_path.name} to {output_path}")
+        return exported
+    
+    def export_parquet(self, file_path: Path, output_file: str,
+                       batch_size: int = PARQUET_BATCH_SIZE) -> int:
+        """
+        Stream every field of a DBF file (memo contents included) to Parquet
         
-        if memo_data:
-            # Save memo data to JSON for analysis
-            output_path = Path(self.config.CSV_OUTPUT_DIR) / output_file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(memo_data, f, indent=2, ensure_ascii=False)
+        Records are read from dbfread in batches of batch_size and each
+        batch is written as one row group, so memory use is bounded by the
+        batch size rather than the file size. Column types are derived
+        from the DBF field definitions.
+        
+        Args:
+            file_path: Path to the DBF file
+            output_file: Parquet file name in the output directory
+            batch_size: Records per row group
             
-            logger.info(f"Exported {len(memo_data)} records with memo fields to {output_path}")
+        Returns:
+            Number of records written
+            
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if pq is None:
+            raise ImportError("Parquet export requires pyarrow: pip install pyarrow")
+        
+        table = self._open_table(file_path)
+        schema = pa.schema([(field.name, _arrow_field_type(field)) for field in table.fields])
+        output_path = Path(self.config.CSV_OUTPUT_DIR) / output_file
+        records = iter(table)
+        exported = 0
+        
+        with pq.ParquetWriter(output_path, schema) as writer:
+            while True:
+                batch = list(islice(records, batch_size))
+                if not batch:
+                    break
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                exported += len(batch)
+        
+        logger.info(f"Exported {exported} records from {file_path.name} to {output_path}")
+        return exported
     
     def get_dbf_info(self, file_path: Path) -> Dict[str, Any]:
         """
@@ -323,29 +818,35 @@ class EnhancedDBFReader:
         Returns:
             Dictionary with detailed file information
         """
+        # One stat per file, shared with analyze_dbf_structure
+        dbf_stat = file_path.stat()
+        
         info = {
             'dbf_file': file_path.name,
-            'dbf_size': file_path.stat().st_size,
-            'dbf_modified': datetime.fromtimestamp(file_path.stat().st_mtime).isoformat(),
+            'dbf_size': dbf_stat.st_size,
+            'dbf_modified': datetime.fromtimestamp(dbf_stat.st_mtime).isoformat(),
             'memo_file': None,
             'memo_size': 0,
-            'structure': self.analyze_dbf_structure(file_path)
+            'structure': self.analyze_dbf_structure(file_path, dbf_stat)
         }
         
         memo_file = self.find_memo_file(file_path)
         if memo_file:
+            memo_stat = memo_file.stat()
             info['memo_file'] = memo_file.name
-            info['memo_size'] = memo_file.stat().st_size
-            info['memo_modified'] = datetime.fromtimestamp(memo_file.stat().st_mtime).isoformat()
+            info['memo_size'] = memo_stat.st_size
+            info['memo_modified'] = datetime.fromtimestamp(memo_stat.st_mtime).isoformat()
         
         return info
     
-    def validate_memo_integrity(self, dbf_path: Path) -> Tuple[bool, List[str]]:
+    def validate_memo_integrity(self, dbf_path: Path,
+                                dbf_stat: Optional[os.stat_result] = None) -> Tuple[bool, List[str]]:
         """
         Validate that DBF and memo files are in sync
         
         Args:
             dbf_path: Path to the DBF file
+            dbf_stat: stat() result for dbf_path, if the caller already has it
             
         Returns:
             Tuple of (is_valid, list_of_issues)
@@ -357,26 +858,34 @@ class EnhancedDBFReader:
             # No memo file expected
             return True, []
         
-        # Check modification times
-        dbf_mtime = dbf_path.stat().st_mtime
-        memo_mtime = memo_file.stat().st_mtime
+        if dbf_stat is None:
+            dbf_stat = dbf_path.stat()
         
-        # If times differ significantly, files might be out of sync
-        if abs(dbf_mtime - memo_mtime) > 60:  # More than 1 minute difference
-            issues.append(
-                f"Modification time mismatch: DBF modified at "
-                f"{datetime.fromtimestamp(dbf_mtime)}, "
-                f"memo at {datetime.fromtimestamp(memo_mtime)}"
-            )
-        
-        # Check if memo file is readable
+        # One open for both the memo mtime (fstat) and its header
         try:
-            with open(memo_file, 'rb') as f:
-                header = f.read(32)
-                if len(header) < 32:
-                    issues.append(f"Memo file appears corrupted (header too short)")
-        except Exception as e:
+            fd = os.open(memo_file, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                memo_stat = os.fstat(fd)
+                header = os.read(fd, 32)
+            finally:
+                os.close(fd)
+        except OSError as e:
             issues.append(f"Cannot read memo file: {e}")
+        else:
+            # If times differ significantly, files might be out of sync
+            dbf_mtime = dbf_stat.st_mtime
+            memo_mtime = memo_stat.st_mtime
+            if abs(dbf_mtime - memo_mtime) > 60:  # More than 1 minute difference
+                issues.append(
+                    f"Modification time mismatch: DBF modified at "
+                    f"{datetime.fromtimestamp(dbf_mtime)}, "
+                    f"memo at {datetime.fromtimestamp(memo_mtime)}"
+                )
+            
+            if len(header) < 32:
+                issues.append(f"Memo file appears corrupted (header too short)")
+            else:
+                issues.extend(_memo_header_issues(memo_file.suffix, header, memo_stat.st_size))
         
         is_valid = len(issues) == 0
         
@@ -386,8 +895,61 @@ class EnhancedDBFReader:
         return is_valid, issues
 
 
+# Per-process reader for process_one_dbf, built once by _init_memo_worker
+_worker_reader: Optional[EnhancedDBFReader] = None
+
+
+def _init_memo_worker(config: Config) -> None:
+    """Build the reader used by process_one_dbf in this worker process"""
+    global _worker_reader
+    _worker_reader = EnhancedDBFReader(config)
+
+
+def process_one_dbf(dbf_path_str: str, memo_path_str: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Gather info, validate, sample and export one DBF (runs in a worker process)
+    
+    Args:
+        dbf_path_str: Path to the DBF file
+        memo_path_str: Memo file found by find_dbf_files, if any
+        
+    Returns:
+        Dictionary with the file info, memo validation result, sample
+        records and the memo export file name (None if nothing exported)
+    """
+    reader = _worker_reader
+    dbf_file = Path(dbf_path_str)
+    memo_file = Path(memo_path_str) if memo_path_str else None
+    # Seed the cache so the worker does not probe for the memo file again
+    reader.memo_cache[dbf_path_str] = memo_file
+    
+    info = reader.get_dbf_info(dbf_file)
+    structure = info['structure']
+    
+    is_valid, issues = reader.validate_memo_integrity(dbf_file) if memo_file else (True, [])
+    
+    # Read sample records (only the first few are needed for display)
+    sample = list(islice(reader.iter_dbf_file(dbf_file, include_memo=True), 5))
+    
+    # Export memo fields if present, streaming the whole file
+    memo_output_file = None
+    if structure['memo_fields']:
+        memo_output_file = f"{dbf_file.stem}_memo_fields.json"
+        reader.export_memo_fields(reader.iter_dbf_file(dbf_file), memo_output_file)
+    
+    return {
+        'info': info,
+        'is_valid': is_valid,
+        'issues': issues,
+        'sample': sample,
+        'memo_output_file': memo_output_file,
+    }
+
+
 def demonstrate_memo_support():
     """Demonstrate the enhanced DBF reader with memo support"""
+    global _worker_reader
+    
     print("\n" + "=" * 80)
     print("ENHANCED DBF READER - MEMO FILE SUPPORT")
     print("=" * 80)
@@ -405,8 +967,22 @@ def demonstrate_memo_support():
         print(f"\n⚠ No DBF files found in {config.DBF_INPUT_DIR}")
         return
     
-    # Process each DBF file
-    for dbf_file, memo_file in dbf_files_with_memos:
+    dbf_paths = [str(dbf_file) for dbf_file, _ in dbf_files_with_memos]
+    memo_paths = [str(memo_file) if memo_file else None for _, memo_file in dbf_files_with_memos]
+    
+    # Files are independent and parsing is CPU-bound Python, so fan them
+    # out to worker processes; not worth starting a pool for a single file
+    if len(dbf_paths) == 1:
+        _worker_reader = reader
+        results = [process_one_dbf(dbf_paths[0], memo_paths[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                 initializer=_init_memo_worker,
+                                 initargs=(config,)) as executor:
+            results = list(executor.map(process_one_dbf, dbf_paths, memo_paths))
+    
+    # Print results in discovery order
+    for (dbf_file, memo_file), result in zip(dbf_files_with_memos, results):
         print(f"\n" + "-" * 80)
         print(f"Processing: {dbf_file.name}")
         
@@ -415,8 +991,7 @@ def demonstrate_memo_support():
         else:
             print(f"  ℹ️  No memo file")
         
-        # Get detailed information
-        info = reader.get_dbf_info(dbf_file)
+        info = result['info']
         
         print(f"\n📊 File Information:")
         print(f"  DBF Size: {info['dbf_size']:,} bytes")
@@ -435,18 +1010,16 @@ def demonstrate_memo_support():
             for field in structure['memo_fields']:
                 print(f"    - {field['name']} (Type: {field['type']})")
         
-        # Validate memo integrity
+        # Memo integrity
         if memo_file:
-            is_valid, issues = reader.validate_memo_integrity(dbf_file)
-            if is_valid:
+            if result['is_valid']:
                 print(f"\n✅ Memo file integrity: OK")
             else:
                 print(f"\n⚠️  Memo file integrity issues:")
-                for issue in issues:
+                for issue in result['issues']:
                     print(f"    - {issue}")
         
-        # Read sample records
-        records = reader.read_dbf_file(dbf_file, limit=5, include_memo=True)
+        records = result['sample']
         
         if records and structure['memo_fields']:
             print(f"\n📝 Sample Memo Content (first record):")
@@ -459,11 +1032,8 @@ def demonstrate_memo_support():
                         preview = str(content)[:200] + "..." if len(str(content)) > 200 else str(content)
                         print(f"  {field_name}: {preview}")
         
-        # Export memo fields if present
-        if structure['memo_fields']:
-            memo_output_file = f"{dbf_file.stem}_memo_fields.json"
-            reader.export_memo_fields(records, memo_output_file)
-            print(f"\n💾 Memo fields exported to: {memo_output_file}")
+        if result['memo_output_file']:
+            print(f"\n💾 Memo fields exported to: {result['memo_output_file']}")
     
     print("\n" + "=" * 80)
     print("✅ Enhanced DBF reading with memo support complete!")
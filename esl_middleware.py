@@ -8,32 +8,96 @@ import sys
 import time
 import signal
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+from contextlib import contextmanager
+from itertools import chain
+from operator import itemgetter
 import json
-import traceback
 import platform
 
 # Third-party imports
-import schedule
 from loguru import logger
-from retrying import retry
-import filelock
+
+# Platform lock primitives for _locked_dbf
+if os.name == 'nt':
+    import msvcrt
+    fcntl = None
+else:
+    import fcntl
+    msvcrt = None
 
 # Import our modules
 from dbf_reader_with_memo import Config as DBFConfig, EnhancedDBFReader as DBFReader
 from incremental_detector import IncrementalDetector, StateTracker
 from data_transformer import FixedDataTransformer, Config as TransformerConfig
 
+# Record carried by each detect_changes() entry
+_record_of = itemgetter('record')
+
+# Seconds between status reports while running
+STATUS_REPORT_INTERVAL = 3600
+
+# Seconds to wait before running jobs again after a scheduler error
+SCHEDULER_ERROR_DELAY = 5
+
+# Upper bound in seconds on the backoff between locked-file read attempts
+MAX_RETRY_WAIT = 10
+
+
+@contextmanager
+def _locked_dbf(file_path: Path) -> Iterator[int]:
+    """
+    Hold a non-blocking shared lock on a DBF file while it is read
+    
+    The lock is taken on the DBF itself, so no .lock sidecar is created.
+    On POSIX a shared flock is held for the duration of the block. On
+    Windows msvcrt only has exclusive byte locks, which would stall the
+    POS writing the file, so the first byte is probed and released.
+    
+    Yields:
+        Open read-only file descriptor of file_path
+    
+    Raises:
+        BlockingIOError: If another process holds a conflicting lock
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_SH | fcntl.LOCK_NB)
+        else:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            except OSError as e:
+                raise BlockingIOError(f"{file_path} is locked") from e
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        yield fd
+    finally:
+        # Closing the descriptor also releases the flock
+        os.close(fd)
+
 
 class ESLMiddleware:
     """Main middleware application with scheduling and error handling"""
     
+    __slots__ = (
+        'config', '_poll_interval', 'running', '_stop_event', 'sync_in_progress',
+        'last_sync_time', 'sync_count', 'error_count', 'state_tracker',
+        'dbf_reader', 'detector', 'transformer', '_file_types', '_stats_lock',
+        '_total_syncs', '_successful_syncs', '_failed_syncs', '_records_processed',
+        '_csv_files_created', '_last_error', '_start_time', '_start_monotonic',
+        '_next_sync', '_next_status', '_executor',
+    )
+    
     def __init__(self, config_file: str = "config.json"):
         """Initialize the middleware with configuration"""
         self.config = DBFConfig(config_file)
+        self._poll_interval = self.config.POLL_INTERVAL  # read once; the scheduler uses it every cycle
         self.running = False
+        self._stop_event = threading.Event()  # set by stop() to wake the scheduler
+        self._next_sync = self._next_status = 0.0  # monotonic due times, set by begin()
         self.sync_in_progress = False
         self.last_sync_time = None
         self.sync_count = 0
@@ -44,20 +108,25 @@ class ESLMiddleware:
         self.dbf_reader = DBFReader(self.config)
         self.detector = IncrementalDetector(self.config, self.state_tracker)
         self.transformer = FixedDataTransformer(TransformerConfig(config_file))
+        self._file_types: Dict[str, Tuple[str, str]] = {}  # file name -> (file type, id field)
+        # Worker pool shared by every sync cycle; created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
         
         # Setup logging
         self.setup_enhanced_logging()
         
-        # Statistics tracking
-        self.stats = {
-            'total_syncs': 0,
-            'successful_syncs': 0,
-            'failed_syncs': 0,
-            'records_processed': 0,
-            'csv_files_created': 0,
-            'last_error': None,
-            'start_time': datetime.now()
-        }
+        # Statistics tracking; counters are updated together under the
+        # lock so snapshot() never sees half of a cycle's totals
+        self._stats_lock = threading.Lock()
+        self._total_syncs = 0
+        self._successful_syncs = 0
+        self._failed_syncs = 0
+        self._records_processed = 0
+        self._csv_files_created = 0
+        self._last_error: Optional[str] = None
+        self._start_time = datetime.now()
+        # Uptime is measured on the monotonic clock (immune to clock changes)
+        self._start_monotonic = time.monotonic()
         
     def setup_enhanced_logging(self):
         """Setup comprehensive logging with rotation and multiple outputs"""
@@ -67,6 +136,9 @@ class ESLMiddleware:
         # Remove default logger
         logger.remove()
         
+        # File sinks are enqueued: formatting and disk writes happen on
+        # loguru's writer thread instead of blocking the sync workers
+        
         # Main log file
         main_log = log_dir / f"esl_middleware_{datetime.now():%Y%m%d}.log"
         logger.add(
@@ -76,7 +148,8 @@ class ESLMiddleware:
             level="INFO",
             format="{time:YYYY-MM-DD HH:mm:ss} | {level:8} | {message}",
             backtrace=True,
-            diagnose=True
+            diagnose=True,
+            enqueue=True
         )
         
         # Error log file
@@ -88,7 +161,8 @@ class ESLMiddleware:
             level="ERROR",
             format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}\n{exception}",
             backtrace=True,
-            diagnose=True
+            diagnose=True,
+            enqueue=True
         )
         
         # Console output with color
@@ -108,31 +182,51 @@ class ESLMiddleware:
         logger.info(f"Poll Interval: {self.config.POLL_INTERVAL} seconds")
         logger.info("=" * 80)
     
-    @retry(
-        wait_exponential_multiplier=1000,
-        wait_exponential_max=10000,
-        stop_max_attempt_number=3
-    )
     def read_dbf_with_retry(self, file_path: Path, limit: Optional[int] = None) -> List[Dict]:
-        """Read DBF file with retry logic for file locking issues"""
-        try:
-            # Try to acquire a file lock (non-blocking)
-            lock_file = f"{file_path}.lock"
-            lock_timeout = 10
-            
-            # Create lock with timeout
-            lock = filelock.FileLock(lock_file, timeout=lock_timeout)
-            
+        """Read DBF file with retry logic for file locking issues (see _read_locked)"""
+        return self._read_locked(file_path, self.dbf_reader.read_dbf_file, file_path, limit)
+    
+    def _read_locked(self, file_path: Path, read, *args, **kwargs):
+        """
+        Call read(*args, **kwargs) while holding the lock on a DBF file
+        
+        A locked file is retried up to MAX_RETRIES attempts, backing off
+        exponentially from RETRY_DELAY seconds (capped at MAX_RETRY_WAIT).
+        The wait ends early if the middleware is stopped. read is only
+        called once the lock is held, so a retry never repeats its work.
+        """
+        attempts = max(1, self.config.MAX_RETRIES)
+        for attempt in range(1, attempts + 1):
             try:
-                with lock.acquire(timeout=lock_timeout):
-                    return self.dbf_reader.read_dbf_file(file_path, limit)
-            except filelock.Timeout:
+                # Fail fast if the file is locked and back off below
+                with _locked_dbf(file_path):
+                    return read(*args, **kwargs)
+            except BlockingIOError as e:
+                if attempt == attempts or self._stop_event.is_set():
+                    logger.error(f"Error reading {file_path}: {e}")
+                    raise
                 logger.warning(f"File locked: {file_path}. Retrying...")
+                self._stop_event.wait(min(self.config.RETRY_DELAY * 2 ** (attempt - 1), MAX_RETRY_WAIT))
+            except Exception as e:
+                logger.error(f"Error reading {file_path}: {e}")
                 raise
-                
-        except Exception as e:
-            logger.error(f"Error reading {file_path}: {e}")
-            raise
+    
+    def classify_file(self, file_name: str) -> Tuple[str, str]:
+        """
+        Get the file type and record id field for a DBF file name
+        
+        File names are stable across cycles, so the result is computed
+        once per name and reused.
+        
+        Returns:
+            Tuple of (file_type, id_field)
+        """
+        classification = self._file_types.get(file_name)
+        if classification is None:
+            file_type = self.transformer.detect_file_type(file_name)
+            id_field = 'DOC_NO' if file_type == 'TRANSACTION' else 'PART_NO'
+            classification = self._file_types[file_name] = (file_type, id_field)
+        return classification
     
     def process_single_file(self, dbf_file: Path) -> Dict[str, int]:
         """Process a single DBF file and return statistics"""
@@ -141,6 +235,8 @@ class ESLMiddleware:
             'updated_records': 0,
             'deleted_records': 0,
             'csv_created': False,
+            'csv_write': None,
+            'file_state': None,
             'error': None
         }
         
@@ -148,51 +244,75 @@ class ESLMiddleware:
             logger.info(f"Processing: {dbf_file.name}")
             
             # Detect file type
-            file_type = self.transformer.detect_file_type(dbf_file.name)
-            id_field = 'DOC_NO' if file_type == 'TRANSACTION' else 'PART_NO'
+            file_type, id_field = self.classify_file(dbf_file.name)
             
-            # Detect changes with retry logic
-            changes = self.detector.detect_changes(
+            # Detect changes under the DBF lock; files untouched since the
+            # last scan are skipped by the detector without being parsed
+            changes = self._read_locked(
+                dbf_file,
+                self.detector.detect_changes,
                 dbf_file, 
                 id_field=id_field,
                 track_doc_no=(file_type == 'TRANSACTION')
             )
             
+            # Pending state (signature, record checksums); stored by
+            # _finish_file once the CSV is written
+            stats['file_state'] = changes.get('file_state')
+            
             # Update statistics
             stats['new_records'] = len(changes['new'])
             stats['updated_records'] = len(changes['updated'])
             stats['deleted_records'] = len(changes['deleted'])
             
-            # Get records for synchronization
-            sync_records = []
-            for item in changes['new']:
-                sync_records.append(item['record'])
-            for item in changes['updated']:
-                sync_records.append(item['record'])
+            # Get records for synchronization (built in C, in one pass)
+            sync_records = list(map(_record_of, chain(changes['new'], changes['updated'])))
             
-            # Only create CSV if there are changes
+            # Only create CSV if there are changes. The CSV is written by the
+            # transformer's background writer so this worker can move on;
+            # sync_cycle flushes the queue and settles csv_created/error
+            # from the write's future (see _finish_file)
             if sync_records:
-                csv_path = self.transformer.transform_and_write_batch(
+                stats['csv_write'] = self.transformer.enqueue_write_batch(
                     sync_records,
                     dbf_file.name,
                     file_type
                 )
-                
-                if csv_path:
-                    stats['csv_created'] = True
-                    logger.success(f"✅ CSV created: {Path(csv_path).name} ({len(sync_records)} records)")
-                else:
-                    logger.warning(f"No CSV created for {dbf_file.name}")
+                logger.info(f"CSV queued for {dbf_file.name} ({len(sync_records)} records)")
             else:
                 logger.info(f"No changes detected in {dbf_file.name}")
             
         except Exception as e:
             stats['error'] = str(e)
-            logger.error(f"Error processing {dbf_file.name}: {e}")
-            logger.debug(traceback.format_exc())
+            logger.opt(exception=True).error(f"Error processing {dbf_file.name}: {e}")
             
         return stats
     
+    def _finish_file(self, dbf_file: Path, stats: Dict[str, Any]):
+        """
+        Settle a file's queued CSV write once the writer has been flushed
+        
+        Sets csv_created only if the write succeeded; a failed write is
+        reported in the file's error instead. The state detect_changes
+        returned (signature, record checksums, last_doc_no) is stored only
+        when there was nothing to write or the write succeeded, so after a
+        failed write the next cycle reports the same changes again.
+        """
+        csv_write = stats.pop('csv_write', None)
+        file_state = stats.pop('file_state', None)
+        
+        if csv_write is not None:
+            try:
+                csv_path = csv_write.result()
+            except Exception as e:
+                stats['error'] = f"CSV write failed: {e}"
+                return
+            
+            stats['csv_created'] = True
+            logger.success(f"✅ CSV created: {Path(csv_path).name} (from {dbf_file.name})")
+        
+        self.detector.save_file_signature(dbf_file.name, file_state)
+    
     def sync_cycle(self):
         """Execute one synchronization cycle"""
         if self.sync_in_progress:
@@ -200,7 +320,7 @@ class ESLMiddleware:
             return
         
         self.sync_in_progress = True
-        cycle_start = datetime.now()
+        cycle_start = time.monotonic()
         
         try:
             logger.info(f"Starting sync cycle #{self.sync_count + 1}")
@@ -222,11 +342,31 @@ class ESLMiddleware:
                 'errors': []
             }
             
-            for dbf_tuple in dbf_files:
-                # If dbf_tuple is a tuple, extract the first element (Path), else use as is
-                dbf_file = dbf_tuple[0] if isinstance(dbf_tuple, tuple) else dbf_tuple
-                file_stats = self.process_single_file(dbf_file)
-                
+            # If an entry is a tuple, extract the first element (Path), else use as is
+            dbf_paths = [t[0] if isinstance(t, tuple) else t for t in dbf_files]
+            
+            # Files are independent (own state entry, own CSV), so process
+            # them concurrently; results are aggregated once all are done.
+            # The pool outlives the cycle, so its threads are reused rather
+            # than started and joined every POLL_INTERVAL
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config.SYNC_WORKERS or os.cpu_count() or 1,
+                    thread_name_prefix="esl-sync"
+                )
+            submit, process = self._executor.submit, self.process_single_file
+            futures = {submit(process, f): f for f in dbf_paths}
+            file_results = [(futures[future], future.result()) for future in as_completed(futures)]
+            
+            # Wait for the queued CSVs to land before the cycle counts as done
+            self.transformer.flush()
+            for dbf_file, file_stats in file_results:
+                self._finish_file(dbf_file, file_stats)
+            
+            # Persist this cycle's state updates in one journal append
+            self.state_tracker.flush()
+            
+            for dbf_file, file_stats in file_results:
                 total_stats['files_processed'] += 1
                 total_stats['total_new'] += file_stats['new_records']
                 total_stats['total_updated'] += file_stats['updated_records']
@@ -239,16 +379,17 @@ class ESLMiddleware:
                     total_stats['errors'].append(f"{dbf_file.name}: {file_stats['error']}")
             
             # Update global statistics
-            self.stats['total_syncs'] += 1
-            self.stats['successful_syncs'] += 1
-            self.stats['records_processed'] += (
-                total_stats['total_new'] + 
-                total_stats['total_updated']
-            )
-            self.stats['csv_files_created'] += total_stats['csv_files_created']
+            with self._stats_lock:
+                self._total_syncs += 1
+                self._successful_syncs += 1
+                self._records_processed += (
+                    total_stats['total_new'] + 
+                    total_stats['total_updated']
+                )
+                self._csv_files_created += total_stats['csv_files_created']
             
             # Log cycle summary
-            cycle_duration = (datetime.now() - cycle_start).total_seconds()
+            cycle_duration = time.monotonic() - cycle_start
             
             logger.info("=" * 60)
             logger.info(f"Sync Cycle #{self.sync_count + 1} Complete")
@@ -270,75 +411,152 @@ class ESLMiddleware:
             self.last_sync_time = datetime.now()
             
         except Exception as e:
-            self.stats['failed_syncs'] += 1
-            self.stats['last_error'] = str(e)
+            with self._stats_lock:
+                self._failed_syncs += 1
+                self._last_error = str(e)
             self.error_count += 1
-            logger.error(f"Sync cycle failed: {e}")
-            logger.debug(traceback.format_exc())
+            logger.opt(exception=True).error(f"Sync cycle failed: {e}")
             
         finally:
             self.sync_in_progress = False
     
+    def tick(self) -> float:
+        """
+        Run the periodic sync and hourly status report if they are due
+        
+        Callers sleep on their own stop signal for the returned time, so
+        they wake once per job instead of polling.
+        
+        Returns:
+            Seconds until the next job is due
+        """
+        try:
+            if time.monotonic() >= self._next_sync:
+                self.sync_cycle()
+                # Interval counts from the end of the cycle, so a slow
+                # cycle never queues up back-to-back runs
+                self._next_sync = time.monotonic() + self._poll_interval
+            
+            if time.monotonic() >= self._next_status:
+                self.display_status()
+                self._next_status = time.monotonic() + STATUS_REPORT_INTERVAL
+        except Exception as e:
+            logger.error(f"Scheduler error: {e}")
+            return SCHEDULER_ERROR_DELAY
+        
+        return max(0.0, min(self._next_sync, self._next_status) - time.monotonic())
+    
+    def request_sync(self, delay: float = 0.0):
+        """
+        Bring the next sync forward, e.g. when a DBF file has changed
+        
+        Args:
+            delay: Seconds from now at which the sync becomes due at the
+                latest; lets a burst of writes settle into one sync
+        """
+        self._next_sync = min(self._next_sync, time.monotonic() + delay)
+    
     def run_scheduler(self):
-        """Run the scheduler in a separate thread"""
+        """
+        Run tick() until stopped, sleeping on the stop event in between
+        
+        stop() sets the event, which wakes the thread immediately.
+        """
         while self.running:
-            try:
-                schedule.run_pending()
-                time.sleep(1)
-            except Exception as e:
-                logger.error(f"Scheduler error: {e}")
-                time.sleep(5)
+            if self._stop_event.wait(self.tick()):
+                break
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get a consistent copy of the runtime statistics
+        
+        Returns:
+            Dictionary of counters, last error and start time
+        """
+        with self._stats_lock:
+            return {
+                'total_syncs': self._total_syncs,
+                'successful_syncs': self._successful_syncs,
+                'failed_syncs': self._failed_syncs,
+                'records_processed': self._records_processed,
+                'csv_files_created': self._csv_files_created,
+                'last_error': self._last_error,
+                'start_time': self._start_time
+            }
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Runtime statistics (a snapshot; mutating it has no effect)"""
+        return self.snapshot()
     
     def display_status(self):
         """Display current status and statistics"""
-        uptime = datetime.now() - self.stats['start_time']
-        
-        print("\n" + "=" * 80)
-        print("ESL MIDDLEWARE STATUS")
-        print("=" * 80)
-        print(f"Platform: {platform.system()}")
-        print(f"Status: {'RUNNING' if self.running else 'STOPPED'}")
-        print(f"Uptime: {uptime}")
-        print(f"Last Sync: {self.last_sync_time or 'Never'}")
-        print(f"Total Syncs: {self.stats['total_syncs']}")
-        print(f"Successful: {self.stats['successful_syncs']}")
-        print(f"Failed: {self.stats['failed_syncs']}")
-        print(f"Records Processed: {self.stats['records_processed']:,}")
-        print(f"CSV Files Created: {self.stats['csv_files_created']}")
-        print(f"Current Errors: {self.error_count}")
-        
-        if self.stats['last_error']:
-            print(f"Last Error: {self.stats['last_error']}")
-        
-        print("=" * 80)
+        uptime = timedelta(seconds=time.monotonic() - self._start_monotonic)
+        stats = self.snapshot()
+        
+        lines = [
+            "",
+            "=" * 80,
+            "ESL MIDDLEWARE STATUS",
+            "=" * 80,
+            f"Platform: {platform.system()}",
+            f"Status: {'RUNNING' if self.running else 'STOPPED'}",
+            f"Uptime: {uptime}",
+            f"Last Sync: {self.last_sync_time or 'Never'}",
+            f"Total Syncs: {stats['total_syncs']}",
+            f"Successful: {stats['successful_syncs']}",
+            f"Failed: {stats['failed_syncs']}",
+            f"Records Processed: {stats['records_processed']:,}",
+            f"CSV Files Created: {stats['csv_files_created']}",
+            f"Current Errors: {self.error_count}",
+        ]
+        
+        if stats['last_error']:
+            lines.append(f"Last Error: {stats['last_error']}")
+        
+        lines.append("=" * 80)
+        
+        # One write per report instead of a locked write per line
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
-    def start(self):
-        """Start the middleware"""
+    def begin(self):
+        """
+        Mark the middleware running, run the initial sync and schedule jobs
+        
+        After this, call tick() whenever it last said a job is due; start()
+        does so on a scheduler thread, the Windows service on its own.
+        """
         logger.info("Starting ESL Middleware...")
         
         self.running = True
+        self._stop_event.clear()
         
         # Run initial sync
         logger.info("Running initial synchronization...")
         self.sync_cycle()
         
-        # Schedule periodic syncs
-        schedule.every(self.config.POLL_INTERVAL).seconds.do(self.sync_cycle)
-        
-        # Schedule hourly status report
-        schedule.every().hour.do(self.display_status)
+        self._next_sync = time.monotonic() + self._poll_interval
+        self._next_status = time.monotonic() + STATUS_REPORT_INTERVAL
+    
+    def start(self):
+        """Start the middleware and block until stop() is called"""
+        self.begin()
         
-        # Start scheduler thread
+        # Start scheduler thread (periodic syncs and hourly status report)
         scheduler_thread = threading.Thread(target=self.run_scheduler, daemon=True)
         scheduler_thread.start()
         
-        logger.success(f"✅ Middleware started. Syncing every {self.config.POLL_INTERVAL} seconds")
+        logger.success(f"✅ Middleware started. Syncing every {self._poll_interval} seconds")
         logger.info("Press Ctrl+C to stop")
         
-        # Keep main thread alive
+        # Keep main thread asleep until stop() sets the event. Windows cannot
+        # interrupt a blocking wait with Ctrl+C, so only there wake once a
+        # second; elsewhere SIGINT/SIGTERM reach stop() through the handler
+        wait_timeout = 1 if os.name == 'nt' else None
         try:
-            while self.running:
-                time.sleep(1)
+            while not self._stop_event.wait(wait_timeout):
+                pass
         except KeyboardInterrupt:
             self.stop()
     
@@ -346,6 +564,7 @@ class ESLMiddleware:
         """Stop the middleware gracefully"""
         logger.info("Stopping ESL Middleware...")
         self.running = False
+        self._stop_event.set()
         
         # Wait for current sync to complete
         if self.sync_in_progress:
@@ -355,13 +574,21 @@ class ESLMiddleware:
             while self.sync_in_progress and (time.time() - start) < timeout:
                 time.sleep(0.5)
         
+        # Release the sync workers (idle once the cycle has finished)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        
         # Display final status
         self.display_status()
         
-        # Save state
-        self.state_tracker.save_state()
+        # Save state; the shutdown checkpoint is synced to disk
+        self.state_tracker.save_state(fsync=True)
         
         logger.success("✅ Middleware stopped gracefully")
+        
+        # Drain the enqueued file sinks before the process exits
+        logger.complete()
 
 
 def signal_handler(signum, frame):
@@ -375,13 +602,16 @@ def signal_handler(signum, frame):
 def main():
     """Main entry point"""
     global middleware
-    print("\n" + "=" * 80)
-    print("ESL INVENTORY SYNCHRONIZATION MIDDLEWARE")
-    print("=" * 80)
-    print("Version: 1.0.0 (Cross-Platform)")
-    print(f"Platform: {platform.system()}")
-    print("Press Ctrl+C to stop")
-    print("=" * 80 + "\n")
+    sys.stdout.write(
+        "\n" + "=" * 80 + "\n"
+        "ESL INVENTORY SYNCHRONIZATION MIDDLEWARE\n"
+        + "=" * 80 + "\n"
+        "Version: 1.0.0 (Cross-Platform)\n"
+        f"Platform: {platform.system()}\n"
+        "Press Ctrl+C to stop\n"
+        + "=" * 80 + "\n\n"
+    )
+    sys.stdout.flush()
     
     # Register signal handlers
     signal.signal(signal.SIGINT, signal_handler)
@@ -426,8 +656,7 @@ def main():
         print("  pip3 install -r requirements.txt")
         sys.exit(1)
     except Exception as e:
-        logger.error(f"Failed to start middleware: {e}")
-        logger.debug(traceback.format_exc())
+        logger.opt(exception=True).error(f"Failed to start middleware: {e}")
         sys.exit(1)
 
 
@@ -4,22 +4,136 @@ Implements hybrid tracking strategy for detecting changes in DBF files
 """
 
 import os
+import sys
 import json
 import hashlib
+import threading
+from operator import itemgetter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Any, Optional
+from typing import Dict, List, Set, Tuple, Any, Iterator, Optional, Union
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from enum import Enum
 
 from dbfread import DBF
 from loguru import logger
 import pandas as pd
 
+# orjson is an optional speedup; fall back to the stdlib encoder when missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# xxhash is an optional speedup for record checksums; without it records
+# keep the MD5 checksums that older state files were written with
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# msgpack is optional; it is only needed for a binary (.msgpack) STATE_FILE
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 # Import from Step 1
 from dbf_reader_with_memo import Config, EnhancedDBFReader as DBFReader
 
 
+def _state_loads(data: bytes) -> Any:
+    """Parse state JSON bytes, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _state_dumps(data: Any, indent: bool = False) -> bytes:
+    """Serialize state to JSON bytes, stringifying values JSON cannot represent"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2, default=str).encode('utf-8')
+    return json.dumps(data, default=str, separators=(',', ':')).encode('utf-8')
+
+
+# Fields left out of record checksums unless the caller overrides them
+DEFAULT_CHECKSUM_EXCLUDED = frozenset(('TIMESTAMP', 'MODIFIED'))
+
+
+# Checksum form of a field value by exact type: stripped text, '' for None,
+# str() for everything else (see _normalize_value)
+_NORMALIZERS = {
+    str: str.strip,
+    type(None): lambda value: "",
+}
+
+
+def _normalize_value(value: Any) -> str:
+    """Checksum form of a field value: stripped text, '' for None"""
+    return _NORMALIZERS.get(type(value), str)(value)
+
+
+def _json_payload(record: Dict, exclude_fields) -> bytes:
+    """Sorted, normalized record as JSON (format of md5/xxh3_64 checksums)"""
+    # Keys are already sorted; plain json.dumps reuses the module's cached
+    # encoder where sort_keys=True would build a new one
+    return json.dumps({
+        key: _normalize_value(value)
+        for key, value in sorted(record.items())
+        if key not in exclude_fields
+    }).encode()
+
+
+def _kv_payload(record: Dict, exclude_fields, _normalizer=_NORMALIZERS.get) -> bytes:
+    """Sorted, normalized record as unit/record-separated key=value bytes"""
+    return '\x1e'.join([
+        f"{key}\x1f{_normalizer(type(value), str)(value)}"
+        for key, value in sorted(record.items())
+        if key not in exclude_fields
+    ]).encode()
+
+
+def _kv_payload_fields(fields: Tuple[str, ...], values: Tuple,
+                      _normalizer=_NORMALIZERS.get) -> bytes:
+    """_kv_payload for a record already split into presorted fields and values"""
+    return '\x1e'.join([
+        f"{key}\x1f{_normalizer(type(value), str)(value)}"
+        for key, value in zip(fields, values)
+    ]).encode()
+
+
+def _md5_hex(data: bytes) -> str:
+    return hashlib.md5(data).hexdigest()
+
+
+# (payload builder, digest) by the scheme name stored in each file's state.
+# Checksums only detect changes, so a fast non-cryptographic hash is used
+# when present, stored as a 64-bit int rather than a 16-char hex string;
+# the hex and JSON schemes are kept to migrate older states
+CHECKSUM_SCHEMES = {
+    'md5': (_json_payload, _md5_hex),
+    'md5-kv': (_kv_payload, _md5_hex),
+}
+if xxhash is not None:
+    CHECKSUM_SCHEMES['xxh3_64'] = (_json_payload, xxhash.xxh3_64_hexdigest)
+    CHECKSUM_SCHEMES['xxh3_64-kv'] = (_kv_payload, xxhash.xxh3_64_hexdigest)
+    CHECKSUM_SCHEMES['xxh3_64-kv-int'] = (_kv_payload, xxhash.xxh3_64_intdigest)
+
+# Scheme used for new checksums; state written before it was recorded is MD5
+CHECKSUM_ALGORITHM = 'xxh3_64-kv-int' if xxhash is not None else 'md5-kv'
+LEGACY_CHECKSUM_ALGORITHM = 'md5'
+
+
+# Read size used when hashing whole DBF/memo files
+FILE_HASH_CHUNK_SIZE = 1 << 20
+
+# STATE_FILE suffix that selects a MessagePack snapshot instead of JSON
+MSGPACK_STATE_SUFFIX = '.msgpack'
+
+
 class ChangeType(Enum):
     """Types of changes detected in DBF records"""
     NEW = "NEW"
@@ -30,15 +144,27 @@ class ChangeType(Enum):
 
 @dataclass
 class RecordState:
-    """Represents the state of a single record for tracking"""
+    """
+    Represents the state of a single record for tracking
+    
+    Documents the per-record state schema; detect_changes builds the same
+    dicts directly rather than going through this class per row.
+    """
     record_id: str  # Usually PART_NO for stock, DOC_NO for transactions
-    checksum: str
-    last_seen: str  # ISO timestamp
+    checksum: Union[int, str]  # int for xxh3_64-kv-int, hex for MD5 schemes
+    last_seen: str  # ISO timestamp of the scan that last stored the record (new/updated)
     doc_no: Optional[int] = None  # For transaction tracking
     deleted: bool = False
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # Flat fields only, so skip asdict()'s recursive deep copy
+        return {
+            'record_id': self.record_id,
+            'checksum': self.checksum,
+            'last_seen': self.last_seen,
+            'doc_no': self.doc_no,
+            'deleted': self.deleted,
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'RecordState':
@@ -46,68 +172,259 @@ class RecordState:
 
 
 class StateTracker:
-    """Manages persistent state tracking for incremental synchronization"""
+    """Manages persistent state tracking for incremental synchronization
+    
+    The full state is kept as a JSON snapshot in ``state_file``. Between
+    snapshots each update is appended to a journal (``state_file + '.log'``,
+    one JSON object per line) so a sync only writes what changed. The
+    journal is replayed on load and folded into the snapshot every
+    ``SNAPSHOT_INTERVAL`` updates and on ``save_state``.
+    
+    A ``state_file`` ending in ``.msgpack`` stores the snapshot as
+    MessagePack, which is smaller and faster to encode than JSON.
+    If it does not exist yet, the JSON state next to it is loaded once,
+    with its journal replayed, and migrated on the next save.
+    """
+    
+    # Journal entries written before the snapshot is rewritten and the journal compacted
+    SNAPSHOT_INTERVAL = 100
     
     def __init__(self, state_file: str = "state.json"):
         self.state_file = state_file
+        self.journal_file = f"{state_file}.log"
+        self.binary_snapshot = state_file.endswith(MSGPACK_STATE_SUFFIX)
+        if self.binary_snapshot and msgpack is None:
+            raise ImportError(f"msgpack is required for a {MSGPACK_STATE_SUFFIX} state file")
         self.state_data: Dict[str, Dict] = {}
+        self._journal_entries = 0
+        self._pending: List[bytes] = []  # encoded updates not yet in the journal
+        self._dirty = False  # state changed since the snapshot was written
+        # Files may be detected concurrently; serialize state access and saves
+        self._lock = threading.RLock()
         self.load_state()
         
     def load_state(self):
-        """Load state from JSON file"""
-        if os.path.exists(self.state_file):
+        """Load the state snapshot and replay any journaled updates"""
+        snapshot_file, binary = self.state_file, self.binary_snapshot
+        migrated_journal = None
+        if binary and not os.path.exists(snapshot_file):
+            json_file = str(Path(snapshot_file).with_suffix('.json'))
+            if os.path.exists(json_file):
+                logger.info(f"Migrating state from {json_file} to {snapshot_file}")
+                snapshot_file, binary = json_file, False
+                migrated_journal = f"{json_file}.log"
+        self._dirty = snapshot_file != self.state_file
+        
+        if os.path.exists(snapshot_file):
             try:
-                with open(self.state_file, 'r') as f:
-                    raw_data = json.load(f)
+                with open(snapshot_file, 'rb') as f:
+                    data = f.read()
+                    raw_data = msgpack.unpackb(data) if binary else _state_loads(data)
                     self.state_data = raw_data
-                    logger.info(f"State loaded from {self.state_file}")
-                    
-                    # Log summary statistics
-                    for file_name, file_state in self.state_data.items():
-                        if isinstance(file_state, dict) and 'records' in file_state:
-                            record_count = len(file_state['records'])
-                            logger.info(f"  {file_name}: {record_count} records tracked")
+                    logger.info(f"State loaded from {snapshot_file}")
             except Exception as e:
                 logger.warning(f"Could not load state file: {e}. Starting fresh.")
                 self.state_data = {}
         else:
             logger.info("No existing state file. Starting with empty state.")
             self.state_data = {}
+        
+        # Updates journaled against the JSON snapshot come before any made
+        # since; both are folded into the first msgpack snapshot. The old
+        # journal is left in place alongside the JSON state it belongs to
+        if migrated_journal is not None:
+            self._replay_journal(migrated_journal)
+        self._journal_entries = self._replay_journal(self.journal_file)
+        
+        # Log summary statistics
+        for file_name, file_state in self.state_data.items():
+            if isinstance(file_state, dict) and 'records' in file_state:
+                self._share_record_strings(file_state['records'])
+                record_count = len(file_state['records'])
+                logger.info(f"  {file_name}: {record_count} records tracked")
     
-    def save_state(self):
-        """Save state to JSON file with atomic write"""
+    @staticmethod
+    def _share_record_strings(records: Dict[str, Dict]):
+        """
+        Deduplicate strings repeated across loaded record states
+        
+        A parsed state holds a separate copy of every record_id (equal to
+        its key) and of every last_seen timestamp (shared by all records of
+        a scan). Pointing them at one object each cuts the memory of a
+        large state by about a quarter without changing its format.
+        """
+        timestamps = {}
+        for record_id, record_state in records.items():
+            if 'record_id' in record_state:
+                record_state['record_id'] = record_id
+            last_seen = record_state.get('last_seen')
+            if last_seen is not None:
+                record_state['last_seen'] = timestamps.setdefault(last_seen, last_seen)
+    
+    def _replay_journal(self, journal_file: str) -> int:
+        """
+        Apply journaled updates on top of the loaded snapshot
+        
+        Args:
+            journal_file: Journal to replay
+        
+        Returns:
+            Number of journal entries applied
+        """
+        if not os.path.exists(journal_file):
+            return 0
+        
+        applied = 0
+        with open(journal_file, 'rb') as f:
+            for line in f:
+                try:
+                    entry = _state_loads(line)
+                except ValueError:
+                    # A torn final line from an interrupted write
+                    logger.warning(f"Ignoring incomplete entry in {journal_file}")
+                    break
+                self._apply(entry['file'], entry['updates'], entry.get('records'))
+                applied += 1
+        
+        if applied:
+            logger.info(f"Replayed {applied} journaled state updates from {journal_file}")
+        return applied
+    
+    def _apply(self, file_name: str, updates: Dict, records: Optional[Dict] = None):
+        """Merge an update (and optional per-record changes) into a file's state"""
+        file_state = self.get_file_state(file_name)
+        file_state.update(updates)
+        if records:
+            file_state.setdefault('records', {}).update(records)
+        self._dirty = True
+    
+    def save_state(self, fsync: bool = False):
+        """
+        Save a full state snapshot with atomic write and compact the journal
+        
+        A no-op when nothing changed since the last snapshot. JSON snapshots
+        are compact; use ``export_state_json`` for a readable copy.
+        
+        Args:
+            fsync: Flush the snapshot to disk before the rename, for
+                checkpoints that must survive a power loss (e.g. shutdown)
+        """
         temp_file = f"{self.state_file}.tmp"
-        try:
-            with open(temp_file, 'w') as f:
-                json.dump(self.state_data, f, indent=2, default=str)
-            
-            # Atomic rename
-            os.replace(temp_file, self.state_file)
-            logger.debug(f"State saved to {self.state_file}")
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                with open(temp_file, 'wb') as f:
+                    if self.binary_snapshot:
+                        f.write(msgpack.packb(self.state_data, use_bin_type=True, default=str))
+                    else:
+                        f.write(_state_dumps(self.state_data))
+                    if fsync:
+                        f.flush()
+                        os.fsync(f.fileno())
+                
+                # Atomic rename
+                os.replace(temp_file, self.state_file)
+                logger.debug("State saved to {}", self.state_file)
+                
+            except Exception as e:
+                logger.error(f"Failed to save state: {e}")
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+                raise
             
-        except Exception as e:
-            logger.error(f"Failed to save state: {e}")
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
-            raise
+            # Everything journaled or buffered so far is now in the snapshot
+            if os.path.exists(self.journal_file):
+                os.remove(self.journal_file)
+            self._journal_entries = 0
+            self._pending = []
+            self._dirty = False
+    
+    def journal_append(self, file_name: str, updates: Dict, records: Optional[Dict] = None):
+        """
+        Append one state update to the journal immediately
+        
+        Args:
+            file_name: DBF file the update belongs to
+            updates: File-level state fields to set
+            records: Changed record states keyed by record id
+        """
+        self._write_journal([self._journal_line(file_name, updates, records)])
+    
+    @staticmethod
+    def _journal_line(file_name: str, updates: Dict, records: Optional[Dict] = None) -> bytes:
+        """Encode one update as a journal line"""
+        entry = {'file': file_name, 'updates': updates}
+        if records:
+            entry['records'] = records
+        return _state_dumps(entry) + b'\n'
+    
+    def _write_journal(self, lines: List[bytes]):
+        """Append encoded updates to the journal in a single write"""
+        with self._lock:
+            with open(self.journal_file, 'ab', buffering=0) as f:
+                f.write(b''.join(lines))
+            self._journal_entries += len(lines)
+    
+    def flush(self):
+        """
+        Write buffered updates to the journal
+        
+        Called once per sync cycle; a no-op when nothing changed. Takes a
+        full snapshot once ``SNAPSHOT_INTERVAL`` updates are journaled.
+        """
+        with self._lock:
+            if not self._pending:
+                return
+            self._write_journal(self._pending)
+            self._pending = []
+            if self._journal_entries >= self.SNAPSHOT_INTERVAL:
+                self.save_state()
     
     def get_file_state(self, file_name: str) -> Dict:
         """Get state for a specific file"""
-        if file_name not in self.state_data:
-            self.state_data[file_name] = {
-                'last_processed': None,
-                'last_doc_no': 0,
-                'records': {},
-                'file_checksum': None,
-                'last_modified': None
-            }
-        return self.state_data[file_name]
+        with self._lock:
+            if file_name not in self.state_data:
+                self.state_data[file_name] = {
+                    'last_processed': None,
+                    'last_doc_no': 0,
+                    'records': {},
+                    'file_checksum': None,
+                    'last_modified': None
+                }
+            return self.state_data[file_name]
     
-    def update_file_state(self, file_name: str, updates: Dict):
-        """Update state for a specific file"""
-        file_state = self.get_file_state(file_name)
-        file_state.update(updates)
-        self.save_state()
+    def set_file_state(self, file_name: str, file_state: Dict):
+        """
+        Replace a file's whole state, e.g. one computed in a worker process
+        
+        Not journaled; persisted by the next ``save_state()``.
+        """
+        with self._lock:
+            self.state_data[file_name] = file_state
+            self._dirty = True
+    
+    def update_file_state(self, file_name: str, updates: Dict,
+                          records: Optional[Dict] = None, flush: bool = False):
+        """
+        Update state for a specific file
+        
+        The change is applied in memory and buffered for the journal; it
+        reaches disk on the next ``flush()`` (or ``save_state()``), so a sync
+        cycle writes its updates in one append.
+        
+        Args:
+            file_name: DBF file the update belongs to
+            updates: File-level state fields to set
+            records: Changed record states keyed by record id
+            flush: Write the buffered updates to the journal now
+        """
+        with self._lock:
+            self._apply(file_name, updates, records)
+            # Encoded now so later in-memory edits do not leak into this entry
+            self._pending.append(self._journal_line(file_name, updates, records))
+            if flush:
+                self.flush()
 
 
 class IncrementalDetector:
@@ -117,38 +434,62 @@ class IncrementalDetector:
         self.config = config
         self.state_tracker = state_tracker
         self.dbf_reader = DBFReader(config)
+        self._exclude = DEFAULT_CHECKSUM_EXCLUDED
         
     def calculate_record_checksum(self, record: Dict, 
-                                 exclude_fields: Optional[List[str]] = None) -> str:
+                                 exclude_fields: Optional[List[str]] = None,
+                                 algorithm: str = CHECKSUM_ALGORITHM) -> Union[int, str]:
         """
-        Calculate MD5 checksum of a record for change detection
+        Calculate checksum of a record for change detection
         
         Args:
             record: Dictionary containing record data
             exclude_fields: Fields to exclude from checksum (e.g., timestamps)
+            algorithm: Key of CHECKSUM_SCHEMES to hash with
         
         Returns:
-            MD5 hex digest of the record
+            Digest of the record (an int for xxh3_64-kv-int, hex otherwise)
         """
-        exclude_fields = exclude_fields or ['TIMESTAMP', 'MODIFIED']
-        
-        # Create a sorted, consistent representation of the record
-        checksum_data = {}
-        for key, value in sorted(record.items()):
-            if key not in exclude_fields:
-                # Normalize the value
-                if value is None:
-                    checksum_data[key] = ""
-                elif isinstance(value, (int, float)):
-                    checksum_data[key] = str(value)
-                elif isinstance(value, str):
-                    checksum_data[key] = value.strip()
-                else:
-                    checksum_data[key] = str(value)
+        exclude_fields = frozenset(exclude_fields) if exclude_fields else self._exclude
+        
+        build_payload, digest = CHECKSUM_SCHEMES[algorithm]
+        return digest(build_payload(record, exclude_fields))
+    
+    def file_signature(self, file_path: Path) -> List[int]:
+        """
+        Get the modification time and size of a DBF file and its memo file
+        
+        Returns:
+            [mtime_ns, size] of the DBF, followed by the memo file's
+            [mtime_ns, size] when it has one (a list, to round-trip JSON)
+        """
+        dbf_stat = file_path.stat()
+        signature = [dbf_stat.st_mtime_ns, dbf_stat.st_size]
         
-        # Create hash
-        data_str = json.dumps(checksum_data, sort_keys=True)
-        return hashlib.md5(data_str.encode()).hexdigest()
+        memo_file = self.dbf_reader.find_memo_file(file_path)
+        if memo_file:
+            memo_stat = memo_file.stat()
+            signature += [memo_stat.st_mtime_ns, memo_stat.st_size]
+        
+        return signature
+    
+    def file_checksum(self, file_path: Path) -> str:
+        """
+        Hash the raw bytes of a DBF file and its memo file
+        
+        Streams FILE_HASH_CHUNK_SIZE blocks, so memory stays flat for large
+        files. Uses xxh3_64 when xxhash is installed, MD5 otherwise.
+        
+        Returns:
+            Hex digest of the file contents
+        """
+        hasher = xxhash.xxh3_64() if xxhash is not None else hashlib.md5()
+        memo_file = self.dbf_reader.find_memo_file(file_path)
+        for path in (file_path, memo_file) if memo_file else (file_path,):
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(FILE_HASH_CHUNK_SIZE), b''):
+                    hasher.update(chunk)
+        return hasher.hexdigest()
     
     def detect_changes(self, file_path: Path, 
                       id_field: str = "PART_NO",
@@ -159,10 +500,19 @@ class IncrementalDetector:
         Args:
             file_path: Path to the DBF file
             id_field: Primary key field for records (PART_NO for stock, DOC_NO for transactions)
-            track_doc_no: Whether to track DOC_NO for transaction ordering
+            track_doc_no: Whether to track DOC_NO for transaction ordering.
+                Transaction files are append-only, so known records with a
+                DOC_NO at or below the stored last_doc_no are not checksummed
+                and are not reported (not even as unchanged).
         
         Returns:
-            Dictionary with 'new', 'updated', 'deleted', 'unchanged' record lists
+            Dictionary with 'new', 'updated', 'deleted', 'unchanged' record
+            lists. After a full scan it also holds 'file_state', the pending
+            state update (new signature, content checksum, last_doc_no and
+            changed record states). Nothing of it is stored here: the caller
+            saves it with save_file_signature() once the changes have been
+            synced, so after a failed sync the file is read again and the
+            same changes are reported again
         """
         file_name = file_path.name
         file_state = self.state_tracker.get_file_state(file_name)
@@ -175,9 +525,45 @@ class IncrementalDetector:
             'unchanged': []
         }
         
+        # Skip parsing entirely when the file (and memo) were not touched, or
+        # were touched without their bytes changing
+        signature = self.file_signature(file_path)
+        if file_state.get('file_signature') == signature:
+            logger.debug("Skipping {}: unchanged since last scan", file_name)
+            return changes
+        
+        file_checksum = self.file_checksum(file_path)
+        if file_state.get('file_checksum') == file_checksum:
+            logger.debug("Skipping {}: modified time changed but content did not", file_name)
+            self.state_tracker.update_file_state(file_name, {'file_signature': signature})
+            return changes
+        
         current_record_ids = set()
+        # Every record of a DBF has the same keys, so the sorted checksum
+        # field list is built from the first record and reused (kv payload)
+        checksum_fields = field_values = None
+        digest = CHECKSUM_SCHEMES[CHECKSUM_ALGORITHM][1]
+        # New, updated and newly deleted record states; the stored states
+        # are left untouched until save_file_signature()
+        changed_records = {}
         current_timestamp = datetime.now().isoformat()
-        max_doc_no = file_state.get('last_doc_no', 0)
+        max_doc_no = last_doc_no = file_state.get('last_doc_no', 0)
+        skip_settled = track_doc_no and bool(last_doc_no) and bool(previous_records)
+        
+        # Stored checksums from another algorithm are compared with that
+        # algorithm once and rewritten with the current one, so switching
+        # algorithms does not report every record as updated
+        stored_algorithm = file_state.get('checksum_algorithm', LEGACY_CHECKSUM_ALGORITHM)
+        legacy_algorithm = None
+        if previous_records and stored_algorithm != CHECKSUM_ALGORITHM:
+            if stored_algorithm in CHECKSUM_SCHEMES:
+                legacy_algorithm = stored_algorithm
+                logger.info(f"Migrating {file_name} checksums from {stored_algorithm} to {CHECKSUM_ALGORITHM}")
+            else:
+                logger.warning(
+                    f"{file_name} state uses unavailable checksum {stored_algorithm}; "
+                    f"all records will be resent once"
+                )
         
         try:
             logger.info(f"Detecting changes in {file_name}")
@@ -198,34 +584,50 @@ class IncrementalDetector:
                 if track_doc_no and 'DOC_NO' in record:
                     try:
                         doc_no = int(record.get('DOC_NO', 0))
-                        max_doc_no = max(max_doc_no, doc_no)
                     except (ValueError, TypeError):
                         pass
+                    else:
+                        # Already-synced transactions: seen (so not deleted)
+                        # but neither hashed nor reported
+                        if skip_settled and doc_no <= last_doc_no and record_id in previous_records:
+                            continue
+                        max_doc_no = max(max_doc_no, doc_no)
                 
-                # Calculate checksum
-                checksum = self.calculate_record_checksum(record)
+                # Calculate checksum; same bytes as calculate_record_checksum
+                if checksum_fields is None:
+                    checksum_fields = tuple(sorted(key for key in record if key not in self._exclude))
+                    field_values = itemgetter(*checksum_fields)
+                checksum = digest(_kv_payload_fields(checksum_fields, field_values(record)))
                 
-                # Check if record exists in previous state
-                if record_id in previous_records:
-                    prev_state = RecordState.from_dict(previous_records[record_id])
+                # Check if record exists in previous state; compare the stored
+                # checksum directly rather than rebuilding a RecordState per row
+                prev_state = previous_records.get(record_id)
+                if prev_state is not None:
+                    if legacy_algorithm is None:
+                        prev_matches = prev_state['checksum'] == checksum
+                    else:
+                        prev_matches = prev_state['checksum'] == self.calculate_record_checksum(
+                            record, algorithm=legacy_algorithm
+                        )
                     
-                    if prev_state.checksum != checksum:
+                    if not prev_matches:
                         # Record has been updated
                         changes['updated'].append({
                             'record': record,
                             'change_type': ChangeType.UPDATED,
                             'record_id': record_id,
-                            'old_checksum': prev_state.checksum,
+                            'old_checksum': prev_state['checksum'],
                             'new_checksum': checksum
                         })
                         
-                        # Update state
-                        previous_records[record_id] = RecordState(
-                            record_id=record_id,
-                            checksum=checksum,
-                            last_seen=current_timestamp,
-                            doc_no=record.get('DOC_NO')
-                        ).to_dict()
+                        # New state (RecordState layout, built as a dict)
+                        changed_records[record_id] = {
+                            'record_id': record_id,
+                            'checksum': checksum,
+                            'last_seen': current_timestamp,
+                            'doc_no': record.get('DOC_NO'),
+                            'deleted': False,
+                        }
                     else:
                         # Record unchanged
                         changes['unchanged'].append({
@@ -234,8 +636,11 @@ class IncrementalDetector:
                             'record_id': record_id
                         })
                         
-                        # Update last_seen
-                        previous_records[record_id]['last_seen'] = current_timestamp
+                        # State is left alone: presence is tracked by
+                        # current_record_ids and the scan time by the file's
+                        # last_processed
+                        if legacy_algorithm is not None:
+                            changed_records[record_id] = {**prev_state, 'checksum': checksum}
                 else:
                     # New record
                     changes['new'].append({
@@ -245,37 +650,43 @@ class IncrementalDetector:
                         'checksum': checksum
                     })
                     
-                    # Add to state
-                    previous_records[record_id] = RecordState(
-                        record_id=record_id,
-                        checksum=checksum,
-                        last_seen=current_timestamp,
-                        doc_no=record.get('DOC_NO')
-                    ).to_dict()
+                    # New state (RecordState layout, built as a dict)
+                    changed_records[record_id] = {
+                        'record_id': record_id,
+                        'checksum': checksum,
+                        'last_seen': current_timestamp,
+                        'doc_no': record.get('DOC_NO'),
+                        'deleted': False,
+                    }
             
-            # Detect deleted records (in previous state but not in current)
-            for record_id in previous_records:
-                if record_id not in current_record_ids:
-                    prev_state = previous_records[record_id]
-                    if not prev_state.get('deleted', False):
-                        changes['deleted'].append({
-                            'record_id': record_id,
-                            'change_type': ChangeType.DELETED,
-                            'last_state': prev_state
-                        })
-                        
-                        # Mark as deleted
-                        previous_records[record_id]['deleted'] = True
+            # Detect deleted records (in previous state but not in current);
+            # the key-view difference runs in C and leaves only the missing ids
+            for record_id in previous_records.keys() - current_record_ids:
+                prev_state = previous_records[record_id]
+                if not prev_state.get('deleted', False):
+                    changes['deleted'].append({
+                        'record_id': record_id,
+                        'change_type': ChangeType.DELETED,
+                        'last_state': prev_state
+                    })
+                    
+                    # Mark as deleted
+                    changed_records[record_id] = {**prev_state, 'deleted': True}
             
-            # Update file state
-            self.state_tracker.update_file_state(file_name, {
-                'last_processed': current_timestamp,
-                'last_doc_no': max_doc_no,
-                'records': previous_records,
-                'last_modified': datetime.fromtimestamp(
-                    file_path.stat().st_mtime
-                ).isoformat()
-            })
+            # Pending file state; only changed records will be journaled
+            changes['file_state'] = {
+                'updates': {
+                    'last_processed': current_timestamp,
+                    'last_doc_no': max_doc_no,
+                    'checksum_algorithm': CHECKSUM_ALGORITHM,
+                    'file_signature': signature,
+                    'file_checksum': file_checksum,
+                    'last_modified': datetime.fromtimestamp(
+                        file_path.stat().st_mtime
+                    ).isoformat()
+                },
+                'records': changed_records,
+            }
             
             # Log summary
             logger.info(f"Change detection complete for {file_name}:")
@@ -291,46 +702,116 @@ class IncrementalDetector:
         
         return changes
     
-    def get_changed_records_for_sync(self, changes: Dict[str, List[Dict]]) -> List[Dict]:
+    def save_file_signature(self, file_name: str, file_state: Optional[Dict]):
         """
-        Get list of records that need to be synchronized (new + updated)
+        Store the state detect_changes returned for a file
+        
+        Applies and journals the new signature together with the changed
+        record states and last_doc_no. Call once the file's changes have
+        been synced; until then the stored state still reports them.
+        
+        Args:
+            file_name: DBF file the state belongs to
+            file_state: changes['file_state'] from detect_changes (None if
+                the scan was skipped)
+        """
+        if file_state:
+            self.state_tracker.update_file_state(file_name, file_state['updates'],
+                                                 records=file_state['records'])
+    
+    def get_changed_records_for_sync(self, changes: Dict[str, List[Dict]]) -> Iterator[Dict]:
+        """
+        Lazily yield the records that need to be synchronized (new + updated)
+        
+        Records are shaped one at a time, so a large batch is not duplicated
+        in memory next to the change lists.
         
         Args:
             changes: Dictionary of changes from detect_changes()
         
-        Returns:
-            List of records that need synchronization
+        Yields:
+            Records that need synchronization
         """
-        sync_records = []
+        # One timestamp for the whole batch rather than one now() per record
+        sync_timestamp = datetime.now().isoformat()
         
-        # Add new records
+        # Add new and updated records
         for item in changes['new']:
-            record = item['record'].copy()
-            record['_sync_action'] = 'INSERT'
-            record['_sync_timestamp'] = datetime.now().isoformat()
-            sync_records.append(record)
-        
-        # Add updated records
+            yield {**item['record'], '_sync_action': 'INSERT', '_sync_timestamp': sync_timestamp}
         for item in changes['updated']:
-            record = item['record'].copy()
-            record['_sync_action'] = 'UPDATE'
-            record['_sync_timestamp'] = datetime.now().isoformat()
-            sync_records.append(record)
+            yield {**item['record'], '_sync_action': 'UPDATE', '_sync_timestamp': sync_timestamp}
         
         # Note: Deleted records might need special handling depending on ESL requirements
         # For now, we'll include them with a DELETE action
         for item in changes['deleted']:
-            sync_records.append({
-                '_sync_action': 'DELETE',
-                '_sync_timestamp': datetime.now().isoformat(),
-                '_record_id': item['record_id']
-            })
-        
-        return sync_records
+            yield {'_sync_action': 'DELETE', '_sync_timestamp': sync_timestamp, '_record_id': item['record_id']}
+
+
+def export_state_json(state_file: str, output_file: str) -> int:
+    """
+    Write a tracker state (snapshot plus journal) as indented JSON
+    
+    Useful for inspecting a binary .msgpack state file.
+    
+    Args:
+        state_file: STATE_FILE to read
+        output_file: JSON file to write
+    
+    Returns:
+        Number of files in the exported state
+    """
+    tracker = StateTracker(state_file)
+    with open(output_file, 'wb') as f:
+        f.write(_state_dumps(tracker.state_data, indent=True))
+    return len(tracker.state_data)
+
+
+def _demo_file_type(file_name: str) -> Tuple[str, str, bool]:
+    """
+    Classify a DBF file for the demo by its name
+    
+    Returns:
+        Tuple of (description, id_field, track_doc_no)
+    """
+    file_name_upper = file_name.upper()
+    if 'STOCK' in file_name_upper:
+        return "Stock/Inventory", 'PART_NO', False
+    if 'INVOICE' in file_name_upper or 'TRANS' in file_name_upper:
+        return "Transaction", 'DOC_NO', True
+    return "Unknown", 'PART_NO', False  # Default
+
+
+# Detector for the current worker process (set by _init_detect_worker)
+_worker_detector: Optional['IncrementalDetector'] = None
+
+
+def _init_detect_worker(config: Config, state_file: str) -> None:
+    """Build the detector used by detect_one_file in this worker process"""
+    global _worker_detector
+    # Loaded once per worker; workers never flush, so only the parent writes
+    _worker_detector = IncrementalDetector(config, StateTracker(state_file))
+
+
+def detect_one_file(dbf_path_str: str) -> Tuple[Dict[str, List[Dict]], Dict]:
+    """
+    Detect changes in one DBF file (runs in a worker process)
+    
+    Args:
+        dbf_path_str: Path to the DBF file
+    
+    Returns:
+        Tuple of (changes, updated file state) for the parent to merge
+    """
+    dbf_file = Path(dbf_path_str)
+    _, id_field, track_doc = _demo_file_type(dbf_file.name)
+    changes = _worker_detector.detect_changes(dbf_file, id_field=id_field, track_doc_no=track_doc)
+    return changes, _worker_detector.state_tracker.get_file_state(dbf_file.name)
 
 
 def demonstrate_incremental_detection():
     """Demonstrate incremental detection capabilities"""
+    global _worker_detector
+    
     print("\n" + "=" * 80)
     print("ESL MIDDLEWARE - STEP 2: INCREMENTAL DETECTION")
     print("=" * 80)
@@ -347,29 +828,37 @@ def demonstrate_incremental_detection():
         print(f"\n⚠ No DBF files found in {config.DBF_INPUT_DIR}")
         return
     
-    # Process each DBF file
-    for dbf_file in dbf_files:
+    # Files are independent and parsing is CPU-bound, so detect them in
+    # worker processes; a single file is not worth the pool start-up
+    dbf_paths = [str(dbf_file[0]) for dbf_file in dbf_files]
+    if len(dbf_paths) == 1:
+        _worker_detector = detector
+        results = [detect_one_file(dbf_paths[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(dbf_paths)),
+                                 initializer=_init_detect_worker,
+                                 initargs=(config, state_tracker.state_file)) as executor:
+            results = list(executor.map(detect_one_file, dbf_paths))
+    
+    # Merge the workers' file states, then persist them in one snapshot.
+    # Nothing is synced here, so the new signatures are stored straight away
+    for dbf_file, (changes, file_state) in zip(dbf_files, results):
+        state_tracker.set_file_state(dbf_file[0].name, file_state)
+        detector.save_file_signature(dbf_file[0].name, changes.get('file_state'))
+    state_tracker.save_state()
+    
+    # Report each DBF file in discovery order
+    for dbf_file, (changes, _) in zip(dbf_files, results):
         print(f"\n" + "-" * 80)
         print(f"Processing: {dbf_file[0].name}")
         print("-" * 80)
         
         # Determine file type and ID field
-        file_name_upper = dbf_file[0].name.upper()
-        if 'STOCK' in file_name_upper:
-            id_field = 'PART_NO'
-            track_doc = False
-            print(f"File Type: Stock/Inventory (ID field: {id_field})")
-        elif 'INVOICE' in file_name_upper or 'TRANS' in file_name_upper:
-            id_field = 'DOC_NO'
-            track_doc = True
-            print(f"File Type: Transaction (ID field: {id_field})")
-        else:
-            id_field = 'PART_NO'  # Default
-            track_doc = False
+        file_type, id_field, track_doc = _demo_file_type(dbf_file[0].name)
+        if file_type == "Unknown":
             print(f"File Type: Unknown (using default ID field: {id_field})")
-        
-        # Detect changes
-        changes = detector.detect_changes(dbf_file[0], id_field=id_field, track_doc_no=track_doc)
+        else:
+            print(f"File Type: {file_type} (ID field: {id_field})")
         
         # Display change summary
         print(f"\nChange Summary:")
@@ -392,14 +881,16 @@ def demonstrate_incremental_detection():
                 print(f"  - {item['record_id']}: {record}")
         
         # Get records for synchronization
-        sync_records = detector.get_changed_records_for_sync(changes)
-        print(f"\n📤 Records ready for synchronization: {len(sync_records)}")
+        sync_count = sum(1 for _ in detector.get_changed_records_for_sync(changes))
+        print(f"\n📤 Records ready for synchronization: {sync_count}")
         
         # Simulate running again to show incremental behavior
         print(f"\n🔁 Running detection again (should show no changes)...")
         changes2 = detector.detect_changes(dbf_file[0], id_field=id_field, track_doc_no=track_doc)
         print(f"  Second run - New: {len(changes2['new'])}, Updated: {len(changes2['updated'])}")
     
+    state_tracker.flush()
+    
     print("\n" + "=" * 80)
     print("✅ Step 2 Complete: Incremental Detection Implemented!")
     print("✅ State tracking file created: state.json")
@@ -408,6 +899,11 @@ def demonstrate_incremental_detection():
 
 
 if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == '--export-json':
+        file_count = export_state_json(sys.argv[2], sys.argv[3])
+        print(f"Exported state for {file_count} files to {sys.argv[3]}")
+        sys.exit(0)
+    
     try:
         demonstrate_incremental_detection()
     except KeyboardInterrupt:
@@ -75,6 +75,32 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(config.POLL_INTERVAL, 60)
         self.assertTrue(config.DEBUG_MODE)
         
+    def test_reload_skipped_when_unchanged(self):
+        """Test load_from_file only re-parses after the file changes"""
+        with open(self.config_file, 'w') as f:
+            json.dump({"POLL_INTERVAL": 60}, f)
+        
+        config = Config(self.config_file)
+        self.assertFalse(config.load_from_file())
+        
+        with open(self.config_file, 'w') as f:
+            json.dump({"POLL_INTERVAL": 90}, f)
+        stat = os.stat(self.config_file)
+        os.utime(self.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        self.assertTrue(config.load_from_file())
+        self.assertEqual(config.POLL_INTERVAL, 90)
+        
+    def test_load_ignores_unknown_keys(self):
+        """Test that keys without a matching attribute are skipped"""
+        with open(self.config_file, 'w') as f:
+            json.dump({"POLL_INTERVAL": 15, "INCLUDE_MEMO_FIELDS": True}, f)
+        
+        config = Config(self.config_file)
+        
+        self.assertEqual(config.POLL_INTERVAL, 15)
+        self.assertFalse(hasattr(config, "INCLUDE_MEMO_FIELDS"))
+        
     def test_save_to_file(self):
         """Test saving configuration to file"""
         config = Config(self.config_file)
@@ -234,6 +260,949 @@ class TestConfigIntegration(unittest.TestCase):
             self.assertIn("./", config.DBF_INPUT_DIR)
 
 
+class TestDataTransformer(unittest.TestCase):
+    """Tests for DBF -> ESL record transformation"""
+    
+    def setUp(self):
+        """Set up a transformer writing into a temporary directory"""
+        from data_transformer import FixedDataTransformer
+        
+        self.temp_dir = tempfile.mkdtemp()
+        config = Config(os.path.join(self.temp_dir, "transformer_config.json"))
+        config.CSV_OUTPUT_DIR = os.path.join(self.temp_dir, "csv_output")
+        self.transformer = FixedDataTransformer(config)
+        
+    def tearDown(self):
+        """Clean up temporary files"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        
+    def test_include_description_adds_column(self):
+        """Test INCLUDE_DESCRIPTION from config.json adds the Description column"""
+        from data_transformer import FixedDataTransformer
+        
+        config_file = os.path.join(self.temp_dir, "description_config.json")
+        with open(config_file, 'w') as f:
+            json.dump({'INCLUDE_DESCRIPTION': True}, f)
+        
+        config = Config(config_file)
+        self.assertTrue(config.INCLUDE_DESCRIPTION)
+        self.assertTrue(config.to_dict()['INCLUDE_DESCRIPTION'])
+        
+        transformer = FixedDataTransformer(config)
+        record = transformer.transform_record({'PART_NO': 'A1', 'DESC': ' Widget '})
+        self.assertEqual(record['Description'], 'Widget')
+        self.assertNotIn('Description', self.transformer.transform_record({'PART_NO': 'A1'}))
+        
+    def test_price_formatting(self):
+        """Test prices are rendered with exactly two decimals"""
+        record = self.transformer.transform_record({'PART_NO': 'A1', 'PRICE1': '1,234.5'})
+        self.assertEqual(record['CurrentPrice'], '1234.50')
+        
+        record = self.transformer.transform_record({'PART_NO': 'A1', 'PRICE1': 0.07})
+        self.assertEqual(record['CurrentPrice'], '0.07')
+        
+        record = self.transformer.transform_record({'PART_NO': 'A1', 'PRICE1': ' $12 '})
+        self.assertEqual(record['CurrentPrice'], '12.00')
+        
+    def test_numeric_field_types(self):
+        """Test int, Decimal and text values from dbfread convert alike"""
+        for qty, price in ((7, Decimal('4.5')), (Decimal('7.9'), 4.5), ('7.9', '4.50')):
+            record = self.transformer.transform_record({'PART_NO': 'A1', 'QTY': qty, 'PRICE1': price})
+            self.assertEqual(record['StockQuantity'], '7')
+            self.assertEqual(record['CurrentPrice'], '4.50')
+        
+    def test_special_price_preferred(self):
+        """Test SPRICE overrides PRICE1 when set"""
+        record = self.transformer.transform_record(
+            {'PART_NO': 'A1', 'PRICE1': 29.99, 'SPRICE': 19.5}
+        )
+        self.assertEqual(record['CurrentPrice'], '19.50')
+        
+        record = self.transformer.transform_record(
+            {'PART_NO': 'A1', 'PRICE1': 29.99, 'SPRICE': 0}
+        )
+        self.assertEqual(record['CurrentPrice'], '29.99')
+        
+    def test_none_fields_render_empty(self):
+        """Test None values from the reader are treated as empty text"""
+        record = self.transformer.transform_record(
+            {'PART_NO': 'A1 ', 'PRICE1': None, 'QTY': None, 'INTERNAL': None}
+        )
+        self.assertEqual(record['SKU'], 'A1')
+        self.assertEqual(record['CurrentPrice'], '0.00')
+        self.assertEqual(record['StockQuantity'], '0')
+        self.assertEqual(record['TransactionID'], 'A1')
+        
+    def test_batch_matches_record_transform(self):
+        """Test the vectorized batch path agrees with transform_record"""
+        records = [
+            {'PART_NO': ' A1 ', 'PRICE1': '1,234.5', 'QTY': '7.9', 'INTERNAL': '100'},
+            {'PART_NO': 'B2', 'PRICE1': 29.99, 'SPRICE': 19.5, 'QTY': 3},
+            {'PART_NO': '', 'PRICE1': 5, 'QTY': 1},
+            {'PART_NO': 'C3', 'PRICE1': 'n/a', 'QTY': 'x'},
+            # Numeric ID columns with a blank, and quantities that do not fit
+            # an int64 cast, must match the per-record path too
+            {'PART_NO': 100001, 'PRICE1': 1, 'QTY': 'inf', 'INTERNAL': 200002},
+            {'PART_NO': 100002, 'PRICE1': 1, 'QTY': 1e30, 'INTERNAL': None},
+            {'PART_NO': 'D4', 'PRICE1': '$2', 'QTY': '$5', 'SPRICE': ''},
+            {'PART_NO': 'E5', 'PRICE1': 3, 'QTY': 2 ** 60},
+            {'PART_NO': 'F6', 'PRICE1': 'inf', 'QTY': 1},
+        ]
+        batch = self.transformer.transform_batch(records, "STOCK.DBF")
+        
+        for esl_record in batch:
+            esl_record.pop('TimeStampUTC')
+        expected = []
+        for record in records:
+            try:
+                esl_record = self.transformer.transform_record(record)
+            except OverflowError:
+                continue
+            if esl_record['SKU']:
+                esl_record.pop('TimeStampUTC')
+                expected.append(esl_record)
+        self.assertEqual(len(batch), 7)
+        self.assertEqual(batch, expected)
+        self.assertEqual([r['SKU'] for r in batch[3:5]], ['100001', '100002'])
+        self.assertEqual(batch[3]['StockQuantity'], '0')
+        self.assertEqual(batch[4]['StockQuantity'], str(int(1e30)))
+        
+    def test_csv_output_round_trips(self):
+        """Test written CSV parses back, including fields needing quotes"""
+        import csv
+        
+        dbf_records = [
+            {'PART_NO': 'PLAIN', 'PRICE1': 1.5, 'QTY': 3},
+            {'PART_NO': 'COMMA,"QUOTE"', 'PRICE1': 2, 'QTY': '4'},
+        ]
+        csv_path = self.transformer.process_changes(dbf_records, "STOCK.DBF")
+        
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+            
+        self.assertEqual([row['SKU'] for row in rows], ['PLAIN', 'COMMA,"QUOTE"'])
+        self.assertEqual(rows[0]['CurrentPrice'], '1.50')
+        self.assertEqual(rows[1]['StockQuantity'], '4')
+        
+    def test_csv_quotes_only_values_that_need_it(self):
+        """Test CSV rows are quoted only where needed"""
+        records = self.transformer.transform_batch(
+            [{'PART_NO': 'A,1', 'PRICE1': 2, 'QTY': 1, 'INTERNAL': 'say "hi"'},
+             {'PART_NO': 'B2', 'PRICE1': '3.5', 'QTY': 4}],
+            "STOCK.DBF"
+        )
+        csv_path = self.transformer.write_csv_atomic(records, "rows.csv")
+        
+        with open(csv_path, 'rb') as f:
+            raw = f.read()
+        
+        stamps = [record['TimeStampUTC'].encode() for record in records]
+        self.assertEqual(raw.split(b'\r\n')[1:], [
+            b'"A,1",2.00,1,"say ""hi""",' + stamps[0],
+            b'B2,3.50,4,B2,' + stamps[1],
+            b'',
+        ])
+        
+    def test_process_changes_skips_unchanged(self):
+        """Test only_changed drops records already written with the same values"""
+        records = [{'PART_NO': 'A1', 'PRICE1': 2, 'QTY': 1},
+                   {'PART_NO': 'B2', 'PRICE1': 3, 'QTY': 1}]
+        self.assertIsNotNone(self.transformer.process_changes(records, "STOCK.DBF", only_changed=True))
+        
+        # Nothing changed: no file
+        self.assertIsNone(self.transformer.process_changes(records, "STOCK.DBF", only_changed=True))
+        
+        records[1]['QTY'] = 5
+        self.transformer.generate_csv_filename = lambda name: "second.csv"
+        csv_path = self.transformer.process_changes(records, "STOCK.DBF", only_changed=True)
+        with open(csv_path) as f:
+            self.assertEqual(len(f.read().splitlines()), 2)
+        
+    def test_process_changes_writes_every_record_by_default(self):
+        """Test the default call writes all records, even when repeated"""
+        records = [{'PART_NO': 'A1', 'PRICE1': 2, 'QTY': 1},
+                   {'PART_NO': 'B2', 'PRICE1': 3, 'QTY': 1}]
+        
+        for name in ("first.csv", "second.csv"):
+            self.transformer.generate_csv_filename = lambda source, name=name: name
+            with open(self.transformer.process_changes(records, "STOCK.DBF")) as f:
+                self.assertEqual(len(f.read().splitlines()), 3)
+        
+    def test_overwrite_keeps_backup(self):
+        """Test rewriting a file keeps the previous version as .bak"""
+        first = self.transformer.transform_batch([{'PART_NO': 'A1', 'PRICE1': 1}], "STOCK.DBF")
+        second = self.transformer.transform_batch([{'PART_NO': 'A1', 'PRICE1': 2}], "STOCK.DBF")
+        
+        csv_path = self.transformer.write_csv_atomic(first, "same.csv")
+        self.transformer.write_csv_atomic(second, "same.csv")
+        
+        with open(csv_path) as f:
+            self.assertIn('2.00', f.read())
+        with open(Path(csv_path).with_suffix('.bak')) as f:
+            self.assertIn('1.00', f.read())
+        
+    def test_no_csv_when_every_sku_empty(self):
+        """Test streaming writer leaves nothing behind for an empty result"""
+        csv_path = self.transformer.process_changes(
+            [{'PART_NO': '  ', 'PRICE1': 1}], "STOCK.DBF"
+        )
+        
+        self.assertIsNone(csv_path)
+        self.assertEqual(os.listdir(self.transformer.config.CSV_OUTPUT_DIR), [])
+        
+    def test_enqueue_batch_writes_on_flush(self):
+        """Test queued batches are on disk once flush() returns"""
+        records = self.transformer.transform_batch(
+            [{'PART_NO': 'Q1', 'PRICE1': 3, 'QTY': 1}], "STOCK.DBF"
+        )
+        
+        self.transformer.enqueue_batch(records, "queued.csv")
+        self.transformer.flush()
+        
+        output_path = os.path.join(self.transformer.config.CSV_OUTPUT_DIR, "queued.csv")
+        self.assertTrue(os.path.exists(output_path))
+        
+    def test_enqueue_write_batch_returns_final_path(self):
+        """Test a queued raw batch lands at the path its future returns with no temp file left"""
+        csv_write = self.transformer.enqueue_write_batch(
+            [{'PART_NO': 'R1', 'QTY': 2}], "STOCK.DBF", "INVENTORY"
+        )
+        self.transformer.flush()
+        csv_path = csv_write.result(timeout=0)
+        
+        self.assertEqual(os.listdir(self.transformer.config.CSV_OUTPUT_DIR),
+                         [os.path.basename(csv_path)])
+        with open(csv_path, newline='') as f:
+            self.assertEqual(f.read(), "PART_NO,QTY\r\nR1,2\r\n")
+        
+    def test_queued_write_failure_reaches_future(self):
+        """Test a failed background write surfaces through its future after flush()"""
+        shutil.rmtree(self.transformer.config.CSV_OUTPUT_DIR)
+        
+        csv_write = self.transformer.enqueue_write_batch(
+            [{'PART_NO': 'R1', 'QTY': 2}], "STOCK.DBF", "INVENTORY"
+        )
+        self.transformer.flush()
+        
+        self.assertIsInstance(csv_write.exception(timeout=0), OSError)
+        
+    def test_write_batch_keeps_ints_next_to_blank_numeric_fields(self):
+        """Test a blank N field (None from dbfread) leaves the other values as written"""
+        csv_path = self.transformer.transform_and_write_batch(
+            [{'PART_NO': 'A1', 'QTY': 150}, {'PART_NO': 'B2', 'QTY': None}],
+            "STOCK.DBF", "INVENTORY"
+        )
+        with open(csv_path, 'rb') as f:
+            self.assertEqual(f.read(), b"PART_NO,QTY\r\nA1,150\r\nB2,\r\n")
+
+
+def write_test_dbf(path, fields, rows, deleted=()):
+    """Write a minimal dBASE III file; fields are (name, type, length) tuples"""
+    import struct
+    
+    record_length = 1 + sum(length for _, _, length in fields)
+    header_length = 32 + 32 * len(fields) + 1
+    
+    with open(path, 'wb') as f:
+        f.write(struct.pack('<BBBBIHH20x', 0x03, 124, 1, 1,
+                            len(rows), header_length, record_length))
+        for name, field_type, length in fields:
+            f.write(struct.pack('<11sc4xBB14x', name.encode('ascii'),
+                                field_type.encode('ascii'), length, 0))
+        f.write(b'\r')
+        for i, row in enumerate(rows):
+            f.write(b'*' if i in deleted else b' ')
+            for (name, _, length), value in zip(fields, row):
+                f.write(str(value).encode('latin-1').ljust(length)[:length])
+        f.write(b'\x1a')
+
+
+class TestDBFReader(unittest.TestCase):
+    """Tests for the direct DBF record reader"""
+    
+    def setUp(self):
+        """Create a temporary DBF file"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.dbf_path = os.path.join(self.temp_dir, "STOCK.DBF")
+        fields = [('PART_NO', 'C', 10), ('COST', 'N', 8), ('PRICE1', 'N', 8), ('QTY', 'N', 5)]
+        rows = [('A1', '1.00', '29.99', '5'), ('B2', '2.00', '9.50', '0'), ('C3', '3.00', '1.00', '2')]
+        write_test_dbf(self.dbf_path, fields, rows, deleted={1})
+        
+    def tearDown(self):
+        """Clean up temporary files"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        
+    def test_reads_selected_fields(self):
+        """Test only requested columns are returned and deleted rows skipped"""
+        from dbf_reader import iter_dbf_records
+        
+        records = list(iter_dbf_records(self.dbf_path, {'PART_NO', 'PRICE1', 'QTY', 'DESC'}))
+        
+        self.assertEqual(records, [
+            {'PART_NO': 'A1', 'PRICE1': '29.99', 'QTY': '5'},
+            {'PART_NO': 'C3', 'PRICE1': '1.00', 'QTY': '2'},
+        ])
+        
+    def test_dbfread_fallback_returns_text(self):
+        """Test the dbfread fallback yields the same stripped text as the direct reader"""
+        from dbf_reader import USED_FIELDS, iter_dbf_records, iter_used_fields, _iter_dbf_table
+        
+        self.assertEqual(list(_iter_dbf_table(self.dbf_path)),
+                         list(iter_dbf_records(self.dbf_path, USED_FIELDS)))
+        
+        # A binary integer field is not inline text, so it takes the fallback
+        int_path = os.path.join(self.temp_dir, "INT.DBF")
+        write_test_dbf(int_path, [('PART_NO', 'C', 6), ('QTY', 'I', 4)], [('A1', '\x05\x00\x00\x00')])
+        with self.assertRaisesRegex(ValueError, "QTY has type I"):
+            list(iter_dbf_records(int_path, {'QTY'}))
+        self.assertEqual(list(iter_used_fields(int_path)), [{'PART_NO': 'A1', 'QTY': '5'}])
+        
+    def test_reader_returns_full_records(self):
+        """Test read_dbf_file keeps every field while read_used_fields keeps only the used ones"""
+        from dbf_reader import DBFReader
+        
+        # Skip __init__ so no log sink or directories are created
+        reader = object.__new__(DBFReader)
+        
+        records = reader.read_dbf_file(Path(self.dbf_path))
+        self.assertEqual([set(record) for record in records], [{'PART_NO', 'COST', 'PRICE1', 'QTY'}] * 2)
+        self.assertEqual(records[0]['PART_NO'], 'A1')
+        self.assertEqual(reader.read_used_fields(Path(self.dbf_path), limit=1),
+                         [{'PART_NO': 'A1', 'PRICE1': '29.99', 'QTY': '5'}])
+        
+    def test_matches_dbfread(self):
+        """Test decoded values agree with dbfread for the same file"""
+        from dbfread import DBF
+        from dbf_reader import iter_dbf_records
+        
+        expected = [str(record['PRICE1']) for record in DBF(self.dbf_path)]
+        actual = [record['PRICE1'] for record in iter_dbf_records(self.dbf_path, {'PRICE1'})]
+        self.assertEqual([float(v) for v in actual], [float(v) for v in expected])
+
+
+class TestEnhancedDBFReader(unittest.TestCase):
+    """Tests for DBF discovery and memo handling"""
+    
+    def setUp(self):
+        """Set up a reader over a temporary input directory"""
+        from dbf_reader_with_memo import EnhancedDBFReader
+        
+        self.temp_dir = tempfile.mkdtemp()
+        config = Config(os.path.join(self.temp_dir, "config.json"))
+        config.DBF_INPUT_DIR = os.path.join(self.temp_dir, "input")
+        config.CSV_OUTPUT_DIR = os.path.join(self.temp_dir, "output")
+        config.LOG_DIR = os.path.join(self.temp_dir, "logs")
+        self.reader = EnhancedDBFReader(config)
+        self.input_dir = Path(config.DBF_INPUT_DIR)
+        
+    def tearDown(self):
+        """Clean up temporary files"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        
+    def test_find_dbf_files_pairs_memo(self):
+        """Test DBFs are found once each and matched to memo files by stem"""
+        for name in ("STOCK.DBF", "stock.fpt", "OTHER.dbf", "notes.txt"):
+            (self.input_dir / name).write_bytes(b"")
+        
+        found = self.reader.find_dbf_files()
+        
+        self.assertEqual(
+            [(dbf.name, memo.name if memo else None) for dbf, memo in found],
+            [("OTHER.dbf", None), ("STOCK.DBF", "stock.fpt")]
+        )
+        
+    def test_find_dbf_files_recursive(self):
+        """Test recursive discovery pairs memos per directory and skips hidden ones"""
+        for relative in ("STOCK.DBF", "branch/ITEMS.DBF", "branch/items.FPT",
+                         "branch/deep/PRICES.dbf", ".cache/OLD.DBF"):
+            path = self.input_dir / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"")
+        
+        found = self.reader.find_dbf_files(recursive=True)
+        
+        self.assertEqual(
+            [(str(dbf.relative_to(self.input_dir)), memo.name if memo else None) for dbf, memo in found],
+            [("STOCK.DBF", None),
+             (os.path.join("branch", "ITEMS.DBF"), "items.FPT"),
+             (os.path.join("branch", "deep", "PRICES.dbf"), None)]
+        )
+        self.assertEqual([dbf.name for dbf, _ in self.reader.find_dbf_files()], ["STOCK.DBF"])
+        
+    def test_export_memo_fields_streams_json_array(self):
+        """Test memo export consumes a generator and writes a JSON array, or NDJSON on request"""
+        def records():
+            return ({'_record_index': i, 'NOTES': 'x' * 300 if i % 2 else 'short'} for i in range(4))
+        output_dir = Path(self.reader.config.CSV_OUTPUT_DIR)
+        
+        self.reader.export_memo_fields(records(), "memo.json")
+        with open(output_dir / "memo.json", encoding='utf-8') as f:
+            self.assertEqual([item['_record_index'] for item in json.load(f)], [1, 3])
+        
+        self.reader.export_memo_fields(records(), "memo.jsonl", ndjson=True)
+        with open(output_dir / "memo.jsonl", encoding='utf-8') as f:
+            self.assertEqual([json.loads(line)['_record_index'] for line in f], [1, 3])
+        
+    def test_dataframe_read_matches_clean_record(self):
+        """Test the vectorized reader cleans values like clean_record"""
+        dbf_path = self.input_dir / "STOCK.DBF"
+        write_test_dbf(dbf_path, [('PART_NO', 'C', 6), ('QTY', 'N', 4)],
+                       [(' A1', '5'), ('B2', ''), ('C3', '12')])
+        
+        df = self.reader.read_dbf_file_df(dbf_path)
+        records = self.reader.read_dbf_file(dbf_path)
+        
+        self.assertEqual(df.to_dict('records'), records)
+        
+    def test_structure_counts_live_records_without_scan(self):
+        """Test analyze_dbf_structure counts live records like len(DBF), without the dbfread scan"""
+        from unittest.mock import patch
+        from dbfread import DBF
+        
+        dbf_path = self.input_dir / "STOCK.DBF"
+        write_test_dbf(dbf_path, [('PART_NO', 'C', 6), ('QTY', 'N', 4)],
+                       [('A1', '5'), ('B2', '1'), ('C3', '12')], deleted={1})
+        
+        with patch('dbfread.DBF.__len__', side_effect=AssertionError("record scan")):
+            structure = self.reader.analyze_dbf_structure(dbf_path)
+        
+        self.assertEqual(structure['total_records'], len(DBF(str(dbf_path))))
+        self.assertEqual(structure['total_records'], 2)
+        self.assertEqual(structure['header_records'], 3)
+        self.assertEqual([f['name'] for f in structure['regular_fields']], ['PART_NO', 'QTY'])
+        
+    def test_live_record_count_stops_at_header_count(self):
+        """Test the live-record count reads in chunks and ignores bytes past the last record"""
+        from unittest.mock import patch
+        
+        dbf_path = self.input_dir / "STOCK.DBF"
+        write_test_dbf(dbf_path, [('PART_NO', 'C', 6), ('QTY', 'N', 4)],
+                       [('A1', '5'), ('B2', '1'), ('C3', '12')], deleted={1})
+        # No EOF marker, then two stray records a partial write left behind
+        with open(dbf_path, 'r+b') as f:
+            f.seek(-1, os.SEEK_END)
+            f.truncate()
+            f.write(b' ' + b'Z' * 10 + b' ' + b'Y' * 10)
+        
+        with patch('dbf_reader_with_memo.COUNT_CHUNK_RECORDS', 2):
+            structure = self.reader.analyze_dbf_structure(dbf_path)
+        
+        self.assertEqual(structure['total_records'], 2)
+        self.assertEqual(structure['header_records'], 3)
+        
+    def test_export_csv_and_parquet_stream_all_fields(self):
+        """Test full-table CSV and Parquet exports keep every record and field"""
+        import csv
+        
+        dbf_path = self.input_dir / "STOCK.DBF"
+        write_test_dbf(dbf_path, [('PART_NO', 'C', 6), ('DESC', 'C', 10), ('QTY', 'N', 4)],
+                       [('A1', 'Widget', '5'), ('B2', 'Gone', '1'), ('C3', '', '')], deleted={1})
+        output_dir = Path(self.reader.config.CSV_OUTPUT_DIR)
+        
+        self.assertEqual(self.reader.export_csv(dbf_path, "stock.csv"), 2)
+        with open(output_dir / "stock.csv", newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows, [['PART_NO', 'DESC', 'QTY'], ['A1', 'Widget', '5'], ['C3', '', '']])
+        
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            return
+        
+        self.assertEqual(self.reader.export_parquet(dbf_path, "stock.parquet", batch_size=1), 2)
+        self.assertEqual(
+            pq.read_table(output_dir / "stock.parquet").to_pylist(),
+            [{'PART_NO': 'A1', 'DESC': 'Widget', 'QTY': 5}, {'PART_NO': 'C3', 'DESC': '', 'QTY': None}]
+        )
+        
+    def test_arrow_types_for_binary_and_memo_fields(self):
+        """Test B fields map by length (FoxPro double vs dBASE memo) and M maps to text"""
+        from types import SimpleNamespace
+        import dbf_reader_with_memo
+        if dbf_reader_with_memo.pa is None:
+            self.skipTest("pyarrow not available")
+        pa = dbf_reader_with_memo.pa
+        
+        def arrow_type(field_type, length):
+            field = SimpleNamespace(type=field_type, length=length, decimal_count=0)
+            return dbf_reader_with_memo._arrow_field_type(field)
+        
+        self.assertEqual(arrow_type('B', 8), pa.float64())
+        self.assertEqual(arrow_type('B', 10), pa.binary())
+        self.assertEqual(arrow_type('M', 10), pa.string())
+        
+    def test_dbf_header_parsed_once_while_unchanged(self):
+        """Test structure analysis and record reads share one dbfread table"""
+        from unittest.mock import patch
+        
+        dbf_path = self.input_dir / "STOCK.DBF"
+        write_test_dbf(dbf_path, [('PART_NO', 'C', 6)], [('A1',), ('B2',)])
+        
+        structure = self.reader.analyze_dbf_structure(dbf_path)
+        self.assertEqual(structure['version'], 0x03)
+        
+        with patch('dbf_reader_with_memo.DBF', side_effect=AssertionError("reopened")):
+            self.assertIs(self.reader.analyze_dbf_structure(dbf_path), structure)
+            self.assertEqual(len(self.reader.read_dbf_file(dbf_path)), 2)
+        
+        # A rewritten file is parsed again
+        write_test_dbf(dbf_path, [('PART_NO', 'C', 6)], [('A1',)])
+        os.utime(dbf_path, ns=(0, 0))
+        self.assertEqual(self.reader.analyze_dbf_structure(dbf_path)['total_records'], 1)
+        
+    def test_validate_memo_integrity_detects_truncation(self):
+        """Test a memo file shorter than its header's block count is flagged"""
+        import struct
+        
+        dbf_path = self.input_dir / "STOCK.DBF"
+        write_test_dbf(dbf_path, [('PART_NO', 'C', 6)], [('A1',)])
+        memo_path = self.input_dir / "STOCK.FPT"
+        header = struct.pack('>I2xH', 20, 64).ljust(512, b'\0')
+        
+        memo_path.write_bytes(header.ljust(20 * 64, b'\0'))
+        self.assertEqual(self.reader.validate_memo_integrity(dbf_path), (True, []))
+        
+        memo_path.write_bytes(header)
+        is_valid, issues = self.reader.validate_memo_integrity(dbf_path)
+        self.assertFalse(is_valid)
+        self.assertIn("truncated", issues[0])
+        
+    def test_lru_cache_evicts_least_recently_used(self):
+        """Test reader caches stay bounded and keep recently used entries"""
+        from dbf_reader_with_memo import LRUCache
+        
+        cache = LRUCache(maxsize=2)
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache['a'], 1)
+        cache['c'] = 3
+        
+        self.assertEqual(list(cache), ['a', 'c'])
+        self.assertIsNone(cache.get('b'))
+        
+    def test_find_memo_file_without_discovery(self):
+        """Test memo lookup outside discovery matches extensions case-insensitively"""
+        for name in ("ITEMS.DBF", "items.dbt", "items.fpt", "OTHER.DBF"):
+            (self.input_dir / name).write_bytes(b"")
+        
+        self.assertEqual(self.reader.find_memo_file(self.input_dir / "ITEMS.DBF").name, "items.fpt")
+        self.assertIsNone(self.reader.find_memo_file(self.input_dir / "OTHER.DBF"))
+        
+    def test_memo_lookup_is_cached(self):
+        """Test find_memo_file reuses the discovery result without probing"""
+        for name in ("STOCK.DBF", "STOCK.FPT"):
+            (self.input_dir / name).write_bytes(b"")
+        self.reader.find_dbf_files()
+        
+        (self.input_dir / "STOCK.FPT").unlink()
+        memo = self.reader.find_memo_file(self.input_dir / "STOCK.DBF")
+        self.assertEqual(memo.name, "STOCK.FPT")
+        
+        # The next discovery pass refreshes the cache
+        self.reader.find_dbf_files()
+        self.assertIsNone(self.reader.find_memo_file(self.input_dir / "STOCK.DBF"))
+
+
+class TestESLMiddleware(unittest.TestCase):
+    """Tests for middleware helpers that do not need a running service"""
+    
+    def setUp(self):
+        """Create a temporary DBF file"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.dbf_path = os.path.join(self.temp_dir, "STOCK.DBF")
+        write_test_dbf(self.dbf_path, [('PART_NO', 'C', 6)], [('A1',)])
+        
+    def tearDown(self):
+        """Clean up temporary files"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        
+    @unittest.skipIf(os.name == 'nt', "flock is POSIX only")
+    def test_locked_dbf_fails_fast_without_sidecar(self):
+        """Test a DBF held exclusively elsewhere raises instead of waiting"""
+        import fcntl
+        from esl_middleware import _locked_dbf
+        
+        with _locked_dbf(self.dbf_path) as fd:
+            self.assertEqual(os.read(fd, 1), b'\x03')
+        self.assertEqual(os.listdir(self.temp_dir), ["STOCK.DBF"])
+        
+        with open(self.dbf_path, 'rb') as holder:
+            fcntl.flock(holder, fcntl.LOCK_EX)
+            with self.assertRaises(BlockingIOError):
+                with _locked_dbf(self.dbf_path):
+                    pass
+        
+    @unittest.skipIf(os.name == 'nt', "flock is POSIX only")
+    def test_locked_dbf_allows_concurrent_readers(self):
+        """Test readers share the lock instead of serializing on it"""
+        import fcntl
+        from esl_middleware import _locked_dbf
+        
+        with open(self.dbf_path, 'rb') as other_reader:
+            fcntl.flock(other_reader, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            with _locked_dbf(self.dbf_path), _locked_dbf(self.dbf_path) as fd:
+                self.assertEqual(os.read(fd, 1), b'\x03')
+        
+    def test_read_dbf_with_retry_backs_off_on_lock(self):
+        """Test a locked DBF is retried up to MAX_RETRIES attempts"""
+        import threading
+        from unittest.mock import MagicMock, patch
+        import esl_middleware
+        
+        middleware = object.__new__(esl_middleware.ESLMiddleware)
+        middleware.config = MagicMock(MAX_RETRIES=3, RETRY_DELAY=0)
+        middleware._stop_event = threading.Event()
+        middleware.dbf_reader = MagicMock()
+        middleware.dbf_reader.read_dbf_file.return_value = [{'PART_NO': 'A1'}]
+        
+        real_lock = esl_middleware._locked_dbf
+        attempts = []
+        
+        def flaky_lock(path):
+            attempts.append(path)
+            if len(attempts) < 3:
+                raise BlockingIOError("locked")
+            return real_lock(path)
+        
+        with patch.object(esl_middleware, '_locked_dbf', flaky_lock):
+            records = middleware.read_dbf_with_retry(Path(self.dbf_path))
+            self.assertEqual(records, [{'PART_NO': 'A1'}])
+            self.assertEqual(len(attempts), 3)
+            
+            attempts.clear()
+            middleware.config.MAX_RETRIES = 2
+            with self.assertRaises(BlockingIOError):
+                middleware.read_dbf_with_retry(Path(self.dbf_path))
+        
+    def test_process_single_file_detects_under_lock(self):
+        """Test change detection waits out a locked DBF instead of reading it"""
+        import threading
+        from unittest.mock import MagicMock, patch
+        import esl_middleware
+        
+        middleware = object.__new__(esl_middleware.ESLMiddleware)
+        middleware.config = MagicMock(MAX_RETRIES=3, RETRY_DELAY=0)
+        middleware._stop_event = threading.Event()
+        middleware._file_types = {}
+        middleware.transformer = MagicMock()
+        middleware.transformer.detect_file_type.return_value = 'STOCK'
+        middleware.detector = MagicMock()
+        middleware.detector.detect_changes.return_value = {'new': [], 'updated': [], 'deleted': []}
+        
+        real_lock = esl_middleware._locked_dbf
+        attempts = []
+        
+        def flaky_lock(path):
+            attempts.append(path)
+            if len(attempts) < 2:
+                raise BlockingIOError("locked")
+            return real_lock(path)
+        
+        with patch.object(esl_middleware, '_locked_dbf', flaky_lock):
+            stats = middleware.process_single_file(Path(self.dbf_path))
+        
+        self.assertIsNone(stats['error'])
+        self.assertEqual(len(attempts), 2)
+        middleware.detector.detect_changes.assert_called_once()
+        
+    def test_finish_file_reports_csv_write_outcome(self):
+        """Test csv_created and the new file signature follow only a write that succeeded"""
+        from concurrent.futures import Future
+        from unittest.mock import MagicMock
+        import esl_middleware
+        
+        middleware = object.__new__(esl_middleware.ESLMiddleware)
+        middleware.detector = MagicMock()
+        
+        written, failed = Future(), Future()
+        written.set_result(os.path.join(self.temp_dir, "STOCK_INVENTORY_1.csv"))
+        failed.set_exception(OSError("disk full"))
+        signature = {'file_signature': [1, 2], 'file_checksum': 'abc'}
+        ok = {'csv_created': False, 'csv_write': written, 'file_state': signature, 'error': None}
+        bad = {'csv_created': False, 'csv_write': failed, 'file_state': signature, 'error': None}
+        
+        middleware._finish_file(Path(self.dbf_path), bad)
+        middleware.detector.save_file_signature.assert_not_called()
+        self.assertFalse(bad['csv_created'])
+        self.assertIn("disk full", bad['error'])
+        
+        middleware._finish_file(Path(self.dbf_path), ok)
+        self.assertEqual(ok, {'csv_created': True, 'error': None})
+        middleware.detector.save_file_signature.assert_called_once_with("STOCK.DBF", signature)
+        
+    def test_tick_runs_due_jobs_and_returns_next_wait(self):
+        """Test tick() runs only due jobs and reports the time to the next one"""
+        import time
+        from unittest.mock import patch
+        import esl_middleware
+        
+        middleware = object.__new__(esl_middleware.ESLMiddleware)
+        middleware._poll_interval = 30
+        middleware._next_sync = time.monotonic() - 1
+        middleware._next_status = time.monotonic() + 3600
+        
+        with patch.object(esl_middleware.ESLMiddleware, 'sync_cycle') as sync_cycle, \
+                patch.object(esl_middleware.ESLMiddleware, 'display_status') as display_status:
+            wait = middleware.tick()
+            sync_cycle.assert_called_once()
+            display_status.assert_not_called()
+            self.assertTrue(25 < wait <= 30)
+            
+            middleware.tick()
+            sync_cycle.assert_called_once()
+            
+            middleware.request_sync()
+            middleware.tick()
+            self.assertEqual(sync_cycle.call_count, 2)
+            
+            middleware._next_sync = time.monotonic() - 1
+            sync_cycle.side_effect = RuntimeError("boom")
+            self.assertEqual(middleware.tick(), esl_middleware.SCHEDULER_ERROR_DELAY)
+
+
+class TestStateTracker(unittest.TestCase):
+    """Tests for journaled state persistence"""
+    
+    def setUp(self):
+        """Create a temporary state location"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.state_file = os.path.join(self.temp_dir, "state.json")
+        
+    def tearDown(self):
+        """Clean up temporary files"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        
+    def test_updates_are_journaled_and_replayed(self):
+        """Test updates survive a restart without a snapshot and compact on save"""
+        from incremental_detector import StateTracker
+        
+        tracker = StateTracker(self.state_file)
+        tracker.update_file_state("STOCK.DBF", {'last_doc_no': 7},
+                                  records={'A1': {'checksum': 'abc'}})
+        tracker.update_file_state("STOCK.DBF", {'last_doc_no': 9})
+        self.assertFalse(os.path.exists(tracker.journal_file))
+        
+        # Buffered updates reach the journal in one append on flush
+        tracker.flush()
+        self.assertFalse(os.path.exists(self.state_file))
+        with open(tracker.journal_file, 'rb') as f:
+            self.assertEqual(len(f.readlines()), 2)
+        
+        reloaded = StateTracker(self.state_file)
+        file_state = reloaded.get_file_state("STOCK.DBF")
+        self.assertEqual(file_state['last_doc_no'], 9)
+        self.assertEqual(file_state['records'], {'A1': {'checksum': 'abc'}})
+        
+        reloaded.save_state()
+        self.assertTrue(os.path.exists(self.state_file))
+        self.assertFalse(os.path.exists(reloaded.journal_file))
+        self.assertEqual(
+            StateTracker(self.state_file).get_file_state("STOCK.DBF")['last_doc_no'], 9
+        )
+        
+    def test_save_state_skips_unchanged_state(self):
+        """Test snapshots are only written after the state changes"""
+        from incremental_detector import StateTracker
+        
+        tracker = StateTracker(self.state_file)
+        tracker.save_state()
+        self.assertFalse(os.path.exists(self.state_file))
+        
+        tracker.update_file_state("STOCK.DBF", {'last_doc_no': 3})
+        tracker.save_state(fsync=True)
+        self.assertTrue(os.path.exists(self.state_file))
+        
+        os.remove(self.state_file)
+        tracker.save_state()
+        self.assertFalse(os.path.exists(self.state_file))
+        
+    def test_msgpack_state_migrates_from_json(self):
+        """Test a .msgpack STATE_FILE picks up the JSON state and round-trips"""
+        import incremental_detector
+        from incremental_detector import StateTracker, export_state_json
+        if incremental_detector.msgpack is None:
+            self.skipTest("msgpack not installed")
+        
+        tracker = StateTracker(self.state_file)
+        tracker.update_file_state("STOCK.DBF", {'last_doc_no': 4})
+        tracker.save_state()
+        # Journaled after the JSON snapshot; must survive the migration
+        tracker.update_file_state("STOCK.DBF", {'last_doc_no': 6})
+        tracker.flush()
+        
+        binary_file = os.path.join(self.temp_dir, "state.msgpack")
+        migrated = StateTracker(binary_file)
+        self.assertEqual(migrated.get_file_state("STOCK.DBF")['last_doc_no'], 6)
+        migrated.save_state()
+        
+        export_file = os.path.join(self.temp_dir, "export.json")
+        self.assertEqual(export_state_json(binary_file, export_file), 1)
+        with open(export_file) as f:
+            self.assertEqual(json.load(f)["STOCK.DBF"]['last_doc_no'], 6)
+        
+    def test_detect_changes_classifies_records(self):
+        """Test new, updated, unchanged and deleted records across two runs"""
+        from incremental_detector import StateTracker, IncrementalDetector
+        
+        dbf_path = os.path.join(self.temp_dir, "STOCK.DBF")
+        fields = [('PART_NO', 'C', 6), ('QTY', 'N', 4)]
+        write_test_dbf(dbf_path, fields, [('A1', '1'), ('B2', '2'), ('C3', '3')])
+        
+        config = Config(os.path.join(self.temp_dir, "config.json"))
+        config.DBF_INPUT_DIR = config.CSV_OUTPUT_DIR = config.LOG_DIR = self.temp_dir
+        detector = IncrementalDetector(config, StateTracker(self.state_file))
+        
+        first = detector.detect_changes(Path(dbf_path))
+        self.assertEqual(len(first['new']), 3)
+        detector.save_file_signature("STOCK.DBF", first['file_state'])
+        
+        # The presorted-field fast path hashes the same bytes as the public helper
+        for change in first['new']:
+            self.assertEqual(change['checksum'],
+                             detector.calculate_record_checksum(change['record']))
+        
+        write_test_dbf(dbf_path, fields, [('A1', '1'), ('B2', '5')])
+        second = detector.detect_changes(Path(dbf_path))
+        self.assertEqual([c['record_id'] for c in second['unchanged']], ['A1'])
+        self.assertEqual([c['record_id'] for c in second['updated']], ['B2'])
+        self.assertEqual([c['record_id'] for c in second['deleted']], ['C3'])
+        
+    def test_detect_changes_skips_untouched_and_touched_only_files(self):
+        """Test unchanged files are not parsed again, even after a touch"""
+        from unittest.mock import patch
+        from incremental_detector import StateTracker, IncrementalDetector
+        
+        dbf_path = os.path.join(self.temp_dir, "STOCK.DBF")
+        write_test_dbf(dbf_path, [('PART_NO', 'C', 6)], [('A1',)])
+        
+        config = Config(os.path.join(self.temp_dir, "config.json"))
+        config.DBF_INPUT_DIR = config.CSV_OUTPUT_DIR = config.LOG_DIR = self.temp_dir
+        detector = IncrementalDetector(config, StateTracker(self.state_file))
+        first = detector.detect_changes(Path(dbf_path))
+        self.assertEqual(len(first['new']), 1)
+        
+        # Until the caller stores the signature, the file is scanned again
+        with patch.object(detector.dbf_reader, 'read_dbf_file',
+                          wraps=detector.dbf_reader.read_dbf_file) as read_dbf_file:
+            detector.detect_changes(Path(dbf_path))
+            read_dbf_file.assert_called_once()
+        detector.save_file_signature("STOCK.DBF", first['file_state'])
+        
+        stat = os.stat(dbf_path)
+        with patch.object(detector.dbf_reader, 'read_dbf_file') as read_dbf_file:
+            detector.detect_changes(Path(dbf_path))
+            os.utime(dbf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            detector.detect_changes(Path(dbf_path))
+            read_dbf_file.assert_not_called()
+        
+        write_test_dbf(dbf_path, [('PART_NO', 'C', 6)], [('B2',)])
+        changes = detector.detect_changes(Path(dbf_path))
+        self.assertEqual([c['record_id'] for c in changes['new']], ['B2'])
+        
+    def test_transactions_at_or_below_last_doc_no_are_skipped(self):
+        """Test only transactions past last_doc_no are checksummed and reported"""
+        from unittest.mock import patch
+        import incremental_detector
+        from incremental_detector import StateTracker, IncrementalDetector
+        
+        dbf_path = os.path.join(self.temp_dir, "INVOICE.DBF")
+        fields = [('DOC_NO', 'N', 6), ('AMOUNT', 'N', 6)]
+        write_test_dbf(dbf_path, fields, [('1', '10'), ('2', '20')])
+        
+        config = Config(os.path.join(self.temp_dir, "config.json"))
+        config.DBF_INPUT_DIR = config.CSV_OUTPUT_DIR = config.LOG_DIR = self.temp_dir
+        detector = IncrementalDetector(config, StateTracker(self.state_file))
+        first = detector.detect_changes(Path(dbf_path), id_field='DOC_NO', track_doc_no=True)
+        detector.save_file_signature("INVOICE.DBF", first['file_state'])
+        
+        write_test_dbf(dbf_path, fields, [('1', '10'), ('2', '20'), ('3', '30')])
+        with patch.object(incremental_detector, '_kv_payload_fields',
+                          wraps=incremental_detector._kv_payload_fields) as checksum:
+            changes = detector.detect_changes(Path(dbf_path), id_field='DOC_NO', track_doc_no=True)
+        
+        self.assertEqual(checksum.call_count, 1)
+        self.assertEqual([c['record_id'] for c in changes['new']], ['3'])
+        self.assertEqual(changes['deleted'], [])
+        detector.save_file_signature("INVOICE.DBF", changes['file_state'])
+        self.assertEqual(detector.state_tracker.get_file_state("INVOICE.DBF")['last_doc_no'], 3)
+        
+    def test_failed_csv_write_resends_changes_next_cycle(self):
+        """Test a change whose CSV write failed is reported again on the next scan"""
+        from concurrent.futures import Future
+        import esl_middleware
+        from incremental_detector import StateTracker, IncrementalDetector
+        
+        dbf_path = os.path.join(self.temp_dir, "STOCK.DBF")
+        fields = [('PART_NO', 'C', 6), ('PRICE1', 'N', 8)]
+        write_test_dbf(dbf_path, fields, [('A1', '1.00')])
+        
+        config = Config(os.path.join(self.temp_dir, "config.json"))
+        config.DBF_INPUT_DIR = config.CSV_OUTPUT_DIR = config.LOG_DIR = self.temp_dir
+        middleware = object.__new__(esl_middleware.ESLMiddleware)
+        middleware.detector = IncrementalDetector(config, StateTracker(self.state_file))
+        
+        def cycle(write_error=None):
+            changes = middleware.detector.detect_changes(Path(dbf_path))
+            csv_write = Future()
+            if write_error:
+                csv_write.set_exception(write_error)
+            else:
+                csv_write.set_result(os.path.join(self.temp_dir, "STOCK_INVENTORY_1.csv"))
+            stats = {'csv_created': False, 'csv_write': csv_write,
+                     'file_state': changes.get('file_state'), 'error': None}
+            middleware._finish_file(Path(dbf_path), stats)
+            return changes
+        
+        self.assertEqual(len(cycle()['new']), 1)
+        
+        write_test_dbf(dbf_path, fields, [('A1', '2.00')])
+        self.assertEqual(len(cycle(OSError("disk full"))['updated']), 1)
+        
+        retry = cycle()
+        self.assertEqual([c['record_id'] for c in retry['updated']], ['A1'])
+        self.assertEqual(retry['updated'][0]['record']['PRICE1'], 2.0)
+        
+        # Once written, the file is skipped as unchanged
+        self.assertEqual(cycle()['unchanged'], [])
+        
+    def test_legacy_md5_state_is_migrated_without_resending(self):
+        """Test MD5 checksums from older state files still match and are rewritten"""
+        import hashlib
+        from incremental_detector import StateTracker, IncrementalDetector, CHECKSUM_ALGORITHM
+        
+        dbf_path = os.path.join(self.temp_dir, "STOCK.DBF")
+        write_test_dbf(dbf_path, [('PART_NO', 'C', 6), ('QTY', 'N', 4)], [('A1', '1')])
+        
+        # State as written before checksum algorithms were recorded
+        legacy_checksum = hashlib.md5(
+            b'{"PART_NO": "A1", "QTY": "1", "_has_memo": "False", '
+            b'"_record_index": "0", "_source_file": "STOCK.DBF"}'
+        ).hexdigest()
+        with open(self.state_file, 'w') as f:
+            json.dump({"STOCK.DBF": {"last_doc_no": 0, "records": {"A1": {
+                "record_id": "A1", "checksum": legacy_checksum,
+                "last_seen": "2024-01-01T00:00:00", "doc_no": None, "deleted": False
+            }}}}, f)
+        
+        config = Config(os.path.join(self.temp_dir, "config.json"))
+        config.DBF_INPUT_DIR = config.CSV_OUTPUT_DIR = config.LOG_DIR = self.temp_dir
+        tracker = StateTracker(self.state_file)
+        detector = IncrementalDetector(config, tracker)
+        
+        changes = detector.detect_changes(Path(dbf_path))
+        self.assertEqual([c['record_id'] for c in changes['unchanged']], ['A1'])
+        self.assertEqual(changes['updated'], [])
+        
+        detector.save_file_signature("STOCK.DBF", changes['file_state'])
+        tracker.flush()
+        file_state = tracker.get_file_state("STOCK.DBF")
+        self.assertEqual(file_state['checksum_algorithm'], CHECKSUM_ALGORITHM)
+        self.assertEqual(
+            StateTracker(self.state_file).get_file_state("STOCK.DBF")['records']['A1']['checksum'],
+            detector.calculate_record_checksum(detector.dbf_reader.read_dbf_file(Path(dbf_path))[0])
+        )
+
+
 class TestSimpleComponents(unittest.TestCase):
     """Simple tests for basic components that don't require full imports"""
     
@@ -269,6 +1238,11 @@ def run_tests():
     # Add test classes
     suite.addTests(loader.loadTestsFromTestCase(TestConfig))
     suite.addTests(loader.loadTestsFromTestCase(TestConfigIntegration))
+    suite.addTests(loader.loadTestsFromTestCase(TestDataTransformer))
+    suite.addTests(loader.loadTestsFromTestCase(TestDBFReader))
+    suite.addTests(loader.loadTestsFromTestCase(TestEnhancedDBFReader))
+    suite.addTests(loader.loadTestsFromTestCase(TestESLMiddleware))
+    suite.addTests(loader.loadTestsFromTestCase(TestStateTracker))
     suite.addTests(loader.loadTestsFromTestCase(TestSimpleComponents))
     
     # Run tests with verbosity
@@ -6,17 +6,116 @@ Allows the middleware to run as a Windows Service
 import os
 import sys
 import time
+import threading
 import win32serviceutil # type: ignore
 import win32service # type: ignore
 import win32event # type: ignore
+import win32file # type: ignore
+import win32con # type: ignore
+import pywintypes # type: ignore
 import servicemanager
-import socket
 from pathlib import Path
 
-# Add parent directory to path for imports
+from loguru import logger
+
+# Add parent directory to path for imports (esl_middleware is imported by
+# ESLMiddlewareService._init_middleware, so install/remove skip pandas and dbfread)
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from esl_middleware import ESLMiddleware
+# Directory holding config.json (next to the frozen service executable, or
+# to this script when run from source); resolved once at import
+if getattr(sys, 'frozen', False):
+    SERVICE_DIR = Path(sys.executable).parent
+else:
+    SERVICE_DIR = Path(__file__).resolve().parent
+CONFIG_FILE = SERVICE_DIR / "config.json"
+
+# Service messages bound for the Windows event log (see _event_log_sink)
+event_log = logger.bind(event_log=True)
+
+# Seconds a DBF change waits before it triggers a sync, so the burst of
+# writes from one export settles into a single cycle
+CHANGE_SETTLE_DELAY = 2
+
+# Extensions whose changes trigger a sync (DBF tables and their memo files)
+WATCHED_EXTENSIONS = ('.dbf', '.fpt', '.dbt')
+
+# Milliseconds between START_PENDING progress reports while the middleware is built
+START_REPORT_INTERVAL_MS = 1000
+
+# Seconds SvcRun waits, once a stop is requested, for the middleware to
+# finish its sync and save state
+STOP_TIMEOUT = 60
+
+# Milliseconds between STOP_PENDING progress reports to the SCM
+STOP_REPORT_INTERVAL_MS = 5000
+
+
+def _event_log_sink(message):
+    """Write a service message to the Windows event log"""
+    record = message.record
+    if record['level'].no >= logger.level('ERROR').no:
+        servicemanager.LogErrorMsg(record['message'])
+    elif record['level'].no >= logger.level('WARNING').no:
+        servicemanager.LogWarningMsg(record['message'])
+    else:
+        servicemanager.LogInfoMsg(record['message'])
+
+
+class DirectoryWatcher:
+    """
+    Overlapped ReadDirectoryChangesW watch on a single directory
+    
+    ``event`` is signalled when a change notification arrives; call
+    ``changed()`` then to read it and re-arm the watch.
+    """
+    
+    _NOTIFY_FILTER = (win32con.FILE_NOTIFY_CHANGE_FILE_NAME
+                      | win32con.FILE_NOTIFY_CHANGE_SIZE
+                      | win32con.FILE_NOTIFY_CHANGE_LAST_WRITE)
+    
+    def __init__(self, directory: str):
+        self.handle = win32file.CreateFile(
+            directory,
+            0x0001,  # FILE_LIST_DIRECTORY
+            win32con.FILE_SHARE_READ | win32con.FILE_SHARE_WRITE | win32con.FILE_SHARE_DELETE,
+            None,
+            win32con.OPEN_EXISTING,
+            win32con.FILE_FLAG_BACKUP_SEMANTICS | win32con.FILE_FLAG_OVERLAPPED,
+            None
+        )
+        self.overlapped = pywintypes.OVERLAPPED()
+        self.overlapped.hEvent = win32event.CreateEvent(None, 1, 0, None)
+        self.event = self.overlapped.hEvent
+        self.buffer = win32file.AllocateReadBuffer(64 * 1024)
+        self._arm()
+    
+    def _arm(self):
+        """Start waiting for the next batch of change notifications"""
+        win32event.ResetEvent(self.event)
+        win32file.ReadDirectoryChangesW(self.handle, self.buffer, False,
+                                        self._NOTIFY_FILTER, self.overlapped)
+    
+    def changed(self) -> bool:
+        """
+        Read the signalled notifications and re-arm the watch
+        
+        Returns:
+            True if a DBF or memo file changed (or the buffer overflowed)
+        """
+        nbytes = win32file.GetOverlappedResult(self.handle, self.overlapped, True)
+        if nbytes:
+            notifications = win32file.FILE_NOTIFY_INFORMATION(self.buffer, nbytes)
+            relevant = any(name.lower().endswith(WATCHED_EXTENSIONS) for _, name in notifications)
+        else:
+            relevant = True  # more changes than fit in the buffer
+        self._arm()
+        return relevant
+    
+    def close(self):
+        """Cancel the watch and release the directory handle"""
+        win32file.CancelIo(self.handle)
+        self.handle.Close()
 
 
 class ESLMiddlewareService(win32serviceutil.ServiceFramework):
@@ -28,52 +127,144 @@ class ESLMiddlewareService(win32serviceutil.ServiceFramework):
     
     def __init__(self, args):
         win32serviceutil.ServiceFramework.__init__(self, args)
-        self.stop_event = win32event.CreateEvent(None, 0, 0, None)
+        # Manual-reset: stays signalled once SvcStop sets it, so every later
+        # wait (tick loop, watcher loop, SvcRun's stop progress) sees the stop
+        # without re-arming. Nothing ever resets it (no pause/continue), so a
+        # generation counter to tell stop requests apart is not needed
+        self.stop_event = win32event.CreateEvent(None, 1, 0, None)
         self.middleware = None
-        socket.setdefaulttimeout(60)
+        self._init_error = None
+        self._run_error = None
         
-    def SvcStop(self):
-        """Stop the service"""
+    def _init_middleware(self):
+        """Build the middleware (imports, config load, directory checks)"""
+        try:
+            from esl_middleware import ESLMiddleware
+            
+            os.chdir(SERVICE_DIR)
+            self.middleware = ESLMiddleware(str(CONFIG_FILE))
+            
+            # Added after the middleware resets the loguru sinks. Enqueued, so
+            # ReportEvent runs on loguru's writer thread rather than on the
+            # service or SCM thread; middleware.stop() drains it
+            logger.add(_event_log_sink, level="INFO", enqueue=True,
+                       filter=lambda record: record['extra'].get('event_log', False))
+        except Exception as e:
+            self._init_error = e
+        
+    def _run(self):
+        """Run the service loop, keeping any error for SvcRun to raise"""
+        try:
+            self.SvcDoRun()
+        except Exception as e:
+            self._run_error = e
+        
+    def SvcRun(self):
+        """
+        Build the middleware, then run the service
+        
+        Overrides ServiceFramework.SvcRun, which reports RUNNING straight
+        away. The middleware is built on a helper thread while this one
+        reports START_PENDING with an advancing checkpoint, so a slow first
+        import or state load does not hit the SCM start timeout, and a bad
+        configuration still fails the start. The service loop also runs on
+        a helper thread, so once SvcStop has signalled the stop this thread
+        reports STOP_PENDING progress (bounded by STOP_TIMEOUT) while the
+        middleware finishes its sync and saves state.
+        """
+        init_thread = threading.Thread(target=self._init_middleware, name="esl-init")
+        init_thread.start()
+        while init_thread.is_alive():
+            self.ReportServiceStatus(win32service.SERVICE_START_PENDING,
+                                     waitHint=3 * START_REPORT_INTERVAL_MS)
+            init_thread.join(START_REPORT_INTERVAL_MS / 1000)
+        
+        if self._init_error is not None:
+            servicemanager.LogErrorMsg(f"Service failed to start: {self._init_error}")
+            raise self._init_error
+        
+        self.ReportServiceStatus(win32service.SERVICE_RUNNING)
+        # Daemon, so the process can still exit if the stop times out
+        run_thread = threading.Thread(target=self._run, name="esl-service", daemon=True)
+        run_thread.start()
+        
+        deadline = None
+        while True:
+            run_thread.join(STOP_REPORT_INTERVAL_MS / 1000)
+            if not run_thread.is_alive():
+                break
+            if win32event.WaitForSingleObject(self.stop_event, 0) != win32event.WAIT_OBJECT_0:
+                continue
+            if deadline is None:
+                deadline = time.monotonic() + STOP_TIMEOUT
+            elif time.monotonic() >= deadline:
+                event_log.error(f"Middleware did not stop within {STOP_TIMEOUT}s")
+                break
+            # Each report advances the checkpoint
+            self.ReportServiceStatus(win32service.SERVICE_STOP_PENDING,
+                                     waitHint=2 * STOP_REPORT_INTERVAL_MS)
+        
+        if self._run_error is not None:
+            raise self._run_error
+        # The framework reports STOPPED once this returns
         self.ReportServiceStatus(win32service.SERVICE_STOP_PENDING)
-        win32event.SetEvent(self.stop_event)
         
-        # Stop the middleware
-        if self.middleware:
-            self.middleware.stop()
+    def SvcStop(self):
+        """
+        Stop the service
+        
+        Reports STOP_PENDING and wakes the service thread, then returns so
+        the SCM control handler is not held; SvcRun reports progress while
+        the middleware shuts down.
+        """
+        self.ReportServiceStatus(win32service.SERVICE_STOP_PENDING,
+                                 waitHint=2 * STOP_REPORT_INTERVAL_MS)
+        win32event.SetEvent(self.stop_event)
         
     def SvcDoRun(self):
         """Run the service"""
-        servicemanager.LogMsg(
-            servicemanager.EVENTLOG_INFORMATION_TYPE,
-            servicemanager.PYS_SERVICE_STARTED,
-            (self._svc_name_, '')
-        )
+        event_log.info(f"The {self._svc_name_} service has started.")
         
         self.main()
         
+    def _watch_input_directory(self):
+        """Watch DBF_INPUT_DIR for changes, or return None if it cannot be watched"""
+        try:
+            return DirectoryWatcher(os.path.abspath(self.middleware.config.DBF_INPUT_DIR))
+        except pywintypes.error as e:
+            event_log.warning(f"Not watching {self.middleware.config.DBF_INPUT_DIR} for changes "
+                              f"({e.strerror}); polling only")
+            return None
+        
     def main(self):
         """Main service loop"""
         try:
-            # Get the service installation directory
-            service_dir = Path(sys.executable).parent
-            os.chdir(service_dir)
-            
-            # Initialize and start middleware
-            config_file = service_dir / "config.json"
-            self.middleware = ESLMiddleware(str(config_file))
-            
-            # Run middleware in a thread
-            import threading
-            middleware_thread = threading.Thread(target=self.middleware.start)
-            middleware_thread.daemon = True
-            middleware_thread.start()
-            
-            # Wait for stop signal
-            win32event.WaitForSingleObject(self.stop_event, win32event.INFINITE)
+            # Drive the middleware from this thread: run due jobs, then
+            # sleep on the stop event until the next one (SvcStop wakes it).
+            # A DBF change wakes it early; polling stays as the fallback for
+            # shares that do not deliver change notifications
+            watcher = self._watch_input_directory()
+            wait_events = [self.stop_event] + ([watcher.event] if watcher else [])
+            self.middleware.begin()
+            try:
+                while True:
+                    timeout_ms = int(self.middleware.tick() * 1000)
+                    signalled = win32event.WaitForMultipleObjects(wait_events, 0, timeout_ms)
+                    if signalled == win32event.WAIT_OBJECT_0:
+                        break
+                    if signalled == win32event.WAIT_OBJECT_0 + 1 and watcher.changed():
+                        self.middleware.request_sync(CHANGE_SETTLE_DELAY)
+            finally:
+                if watcher:
+                    watcher.close()
             
         except Exception as e:
-            servicemanager.LogErrorMsg(f"Service failed: {e}")
+            event_log.error(f"Service failed: {e}")
             raise
+        
+        finally:
+            # Runs on this thread, so no sync is in flight: flush state here
+            self.middleware.stop()
 
 
 def install_service():